@@ -0,0 +1,54 @@
+# cereon_sdk/_json.py
+"""
+JSON helpers shared by the FastAPI and Django integrations: orjson when installed
+(`pip install orjson`), the stdlib `json` module otherwise.
+
+Values orjson handles differently from `json` are routed to the stdlib so results do not
+depend on which backend is installed:
+- integer literals wider than 64 bits (orjson decodes them as lossy floats, and refuses to
+  encode them);
+- `NaN` / `Infinity` / `-Infinity` tokens, which orjson rejects.
+One difference remains: orjson encodes non-finite floats as `null` where `json` writes
+`NaN` / `Infinity`.
+"""
+import json
+import re
+from typing import Any, Union
+
+try:  # optional fast JSON backend
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# 19+ digit runs may be outside orjson's 64-bit integer range (also matches inside strings
+# and fractions, which only costs a stdlib decode)
+_WIDE_DIGITS = re.compile(r"[0-9]{19}")
+_WIDE_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+
+if orjson is not None:
+    _orjson_loads = orjson.loads
+    _orjson_dumps = orjson.dumps
+    _NON_STR_KEYS = orjson.OPT_NON_STR_KEYS
+
+    def json_loads(text: Union[str, bytes, bytearray]) -> Any:
+        """Decode JSON text (str or bytes) with the same results as `json.loads`."""
+        wide = _WIDE_DIGITS if isinstance(text, str) else _WIDE_DIGITS_BYTES
+        if wide.search(text) is not None:
+            return json.loads(text)
+        try:
+            return _orjson_loads(text)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity tokens, or genuinely invalid text (re-raised by `json`)
+            return json.loads(text)
+
+    def json_dumps(obj: Any) -> str:
+        """Compact JSON text; falls back to `json.dumps` for values orjson cannot encode."""
+        try:
+            return _orjson_dumps(obj, option=_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return json.dumps(obj)
+
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
@@ -0,0 +1,24 @@
+# cereon_sdk/_numbers.py
+"""
+Framework-independent number coercion shared by the FastAPI and Django websocket parsers.
+"""
+from typing import Any
+
+# longest integer text taken by int() fast paths: always within 64 bits (orjson turns
+# wider integers into floats) and far below Python's int string-conversion limit
+FAST_INT_DIGITS = 18
+
+
+def coerce_num(v: Any) -> Any:
+    """int(v), else float(v), else v unchanged; short plain ASCII integers skip the try ladder."""
+    if type(v) is str:
+        digits = v[1:] if v[:1] in ("-", "+") else v
+        if len(digits) <= FAST_INT_DIGITS and digits.isascii() and digits.isdigit():
+            return int(v)
+    try:
+        return int(v)
+    except Exception:
+        try:
+            return float(v)
+        except Exception:
+            return v
@@ -1,20 +1,140 @@
 # cereon_sdk/django/consumers.py
 from __future__ import annotations
 import asyncio
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Iterable, Callable, Type
+import inspect
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Iterable, Callable, Type
 
 
 from rest_framework import serializers
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
-from .utils import parse_websocket_params_from_scope
+from .serializers import BaseCardRecordSerializer
+from .utils import _json_dumps, _json_loads, parse_websocket_params_from_scope
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# last rendered timestamp, reused for every call within the same millisecond
+_iso_cache_ms = 0
+_iso_cache_str = ""
 
 
 def _now_iso() -> str:
-    from datetime import datetime
+    """UTC ISO-8601 timestamp (millisecond precision, `Z` suffix)."""
+    global _iso_cache_ms, _iso_cache_str
+    ms = int(time.time() * 1000)
+    if ms != _iso_cache_ms:
+        _iso_cache_ms = ms
+        _iso_cache_str = (_EPOCH + timedelta(milliseconds=ms)).isoformat(
+            timespec="milliseconds"
+        ).replace("+00:00", "Z")
+    return _iso_cache_str
+
+
+class Subscription(NamedTuple):
+    """A client subscription tracked by `BaseCardConsumer.active_subscriptions`."""
+
+    topic: str
+    ack_policy: str
+    client_info: Dict[str, Any]
+
+
+class _SubscriptionsView(Mapping):
+    """Live read-only `{subscription_id: Subscription}` view over a consumer's subscription arrays."""
+
+    __slots__ = ("_consumer",)
+
+    def __init__(self, consumer: "BaseCardConsumer") -> None:
+        self._consumer = consumer
+
+    def __getitem__(self, sid: str) -> Subscription:
+        c = self._consumer
+        idx = c._sub_index[sid]
+        return Subscription(c._sub_topics[idx], c._sub_ack[idx], c._sub_client[idx])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._consumer._sub_ids)
+
+    def __len__(self) -> int:
+        return len(self._consumer._sub_ids)
+
+    def __contains__(self, sid: object) -> bool:
+        return sid in self._consumer._sub_index
+
+
+@dataclass(slots=True)
+class HandlerCtx:
+    """
+    Context passed to `BaseCardConsumer.handle`.
+
+    Prefer attribute access (`ctx.params`); `ctx["params"]` and `ctx.get("filters")`
+    keep dict-style handlers working.
+    """
+
+    websocket: "BaseCardConsumer"
+    params: Dict[str, Any]
+    filters: Any
+    active_subscriptions: Mapping[str, Subscription]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
+
+
+# Fixed-shape control frames are spliced around the timestamp instead of JSON-encoding
+# a dict per send. They stay text frames: clients expect JSON text, not binary.
+_PING_PREFIX = '{"action":"ping","timestamp":"'
+_PONG_PREFIX = '{"action":"pong","timestamp":"'
+_FRAME_SUFFIX = '"}'
+
+
+# One heartbeat ticker per interval sweeps every live consumer using that interval,
+# instead of one sleeping task per connection.
+_hb_registries: Dict[float, "weakref.WeakSet[BaseCardConsumer]"] = {}
+_hb_tasks: Dict[float, asyncio.Task] = {}
 
-    return datetime.utcnow().isoformat() + "Z"
+
+def _register_heartbeat(consumer: "BaseCardConsumer", interval: float) -> None:
+    registry = _hb_registries.get(interval)
+    if registry is None:
+        registry = _hb_registries[interval] = weakref.WeakSet()
+    registry.add(consumer)
+    task = _hb_tasks.get(interval)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        _hb_tasks[interval] = asyncio.create_task(_heartbeat_ticker(interval, registry))
+
+
+async def _heartbeat_ticker(interval: float, registry: "weakref.WeakSet[BaseCardConsumer]"):
+    """
+    Ping every registered consumer each `interval` seconds; exit once none are left.
+
+    Sends run concurrently and each is bounded by `interval`, so one stuck client cannot hold
+    up heartbeats for the others; consumers whose send fails or times out are dropped.
+    """
+    while registry:
+        await asyncio.sleep(interval)
+        frame = _PING_PREFIX + _now_iso() + _FRAME_SUFFIX
+        consumers = list(registry)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(c.send(text_data=frame), interval) for c in consumers),
+            return_exceptions=True,
+        )
+        for consumer, result in zip(consumers, results):
+            if isinstance(result, BaseException):
+                registry.discard(consumer)
 
 
 def _ensure_async_iter(obj):
@@ -44,29 +164,61 @@ def _ensure_async_iter(obj):
     return _single()
 
 
-class BaseCardConsumer(AsyncJsonWebsocketConsumer, ABC):
+class BaseCardConsumer(AsyncJsonWebsocketConsumer):
     """
     Channels consumer implementing the websocket transport contract.
 
     Subclasses MUST set:
-      - response_model: pydantic model for outgoing messages (optional)
-      - handler: callable(ctx) -> async iterable or coroutine that returns async iterable
+      - response_serializer: DRF serializer for outgoing messages (optional)
+      - handle: `async def handle(self, ctx)` async generator yielding records
+
+    Set `legacy_handler_shapes = True` to keep accepting handlers that return a
+    coroutine, an (async) iterable or a single value.
     """
 
     response_serializer: Optional[Type[serializers.Serializer]] = None
+    legacy_handler_shapes: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        handle = cls.handle
+        if (
+            not cls.legacy_handler_shapes
+            and handle is not BaseCardConsumer.handle
+            and not inspect.isasyncgenfunction(handle)
+        ):
+            raise TypeError(
+                f"{cls.__name__}.handle must be an async generator (`async def` with `yield`); "
+                "set `legacy_handler_shapes = True` to return other shapes."
+            )
 
-    @abstractmethod
-    async def handle(self, ctx: Dict[str, Any]):
+    async def handle(self, ctx: HandlerCtx):
         """
-        Subclasses must implement `async def handle(self, ctx)` which may:
-            - return an async iterable
-            - yield/return values directly
+        Subclasses must implement `async def handle(self, ctx)` as an async generator
+        yielding the records to send.
+
+        The base implementation raises `NotImplementedError`.
         """
         raise NotImplementedError()
 
     ack_policy: str = "auto"
     heartbeat_interval_sec: int = 30
     stream_error_policy: str = "skip"  # 'fail'|'skip'|'log'
+    # When enabled, outgoing records are queued and a writer task sends everything queued
+    # since its last wake as one `{"action": "batch", "items": [...]}` frame.
+    batch_enabled: bool = False
+    batch_max_size: int = 500
+    # high-water mark: the handler waits for the writer once this many entries are queued,
+    # so a fast handler cannot outrun a slow client without bound
+    batch_max_pending: int = 10_000
+
+    @classmethod
+    async def decode_json(cls, text_data):
+        return _json_loads(text_data)
+
+    @classmethod
+    async def encode_json(cls, content):
+        return _json_dumps(content)
 
     async def connect(self):
         await self.accept()
@@ -76,39 +228,55 @@ class BaseCardConsumer(AsyncJsonWebsocketConsumer, ABC):
             self.params = params["params"]
         else:
             self.params = params if isinstance(params, dict) else {}
-        self.active_subscriptions: Dict[str, Dict[str, Any]] = {}
+        # subscriptions stored as parallel arrays indexed through `_sub_index`
+        self._sub_index: Dict[str, int] = {}
+        self._sub_ids: List[str] = []
+        self._sub_topics: List[str] = []
+        self._sub_ack: List[str] = []
+        self._sub_client: List[Dict[str, Any]] = []
+        self._manual_ack_count: int = 0
+        self.active_subscriptions: Mapping[str, Subscription] = _SubscriptionsView(self)
+        # monotonic counter for generated subscription ids (never reused after unsubscribe)
+        self._sub_seq = 0
         self.handler_task = None
-        self.heartbeat_task = None
+        self._loop = asyncio.get_running_loop()
+        # monotonic counter for manual-ack message ids
+        self._msg_seq = 0
+        # (item, is_control) entries drained by `_writer_loop` in batch mode; records are
+        # queued as raw handler items and wrapped into messages at drain time
+        self._outq: deque = deque()
+        self._outq_wake: Optional[asyncio.Future] = None
+        # set while the handler is paused at `batch_max_pending`, resolved after a drain
+        self._outq_space: Optional[asyncio.Future] = None
+        self._writer_task = None
+        # bound once per connection so the per-message call site carries no serializer branch
+        self._send_validated = (
+            self.send_json if self.response_serializer is None else self._send_validated_impl
+        )
+        if self.batch_enabled:
+            self._writer_task = asyncio.create_task(self._writer_loop())
         if self.heartbeat_interval_sec > 0:
-            self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            _register_heartbeat(self, self.heartbeat_interval_sec)
 
     async def disconnect(self, code):
         if self.handler_task and not self.handler_task.done():
             self.handler_task.cancel()
-        if self.heartbeat_task and not self.heartbeat_task.done():
-            self.heartbeat_task.cancel()
-
-    async def _heartbeat_loop(self):
-        try:
-            while True:
-                await asyncio.sleep(self.heartbeat_interval_sec)
-                await self.send_json({"action": "ping", "timestamp": _now_iso()})
-        except asyncio.CancelledError:
-            return
+        registry = _hb_registries.get(self.heartbeat_interval_sec)
+        if registry is not None:
+            registry.discard(self)
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
 
     async def receive_json(self, content: Dict[str, Any], **kwargs):
         action = content.get("action", "")
         if action == "subscribe":
-            subscription_id = content.get(
-                "subscriptionId", f"sub-{id(self)}-{len(self.active_subscriptions)}"
-            )
+            subscription_id = content.get("subscriptionId")
+            if not subscription_id:
+                self._sub_seq += 1
+                subscription_id = f"sub-{id(self)}-{self._sub_seq}"
             topic = content.get("topic", "")
             ack_policy = content.get("ackPolicy", self.ack_policy)
-            self.active_subscriptions[subscription_id] = {
-                "topic": topic,
-                "ackPolicy": ack_policy,
-                "clientInfo": content.get("clientInfo", {}),
-            }
+            self._add_subscription(subscription_id, topic, ack_policy, content.get("clientInfo", {}))
             await self.send_json(
                 {
                     "action": "subscribed",
@@ -124,13 +292,12 @@ class BaseCardConsumer(AsyncJsonWebsocketConsumer, ABC):
 
         elif action == "unsubscribe":
             sid = content.get("subscriptionId")
-            if sid in self.active_subscriptions:
-                del self.active_subscriptions[sid]
+            if self._remove_subscription(sid):
                 await self.send_json(
                     {"action": "unsubscribed", "subscriptionId": sid, "timestamp": _now_iso()}
                 )
         elif action == "ping":
-            await self.send_json({"action": "pong", "timestamp": _now_iso()})
+            await self.send(text_data=_PONG_PREFIX + _now_iso() + _FRAME_SUFFIX)
         elif action == "ack":
             # Override in subclass to track ack state
             pass
@@ -138,55 +305,196 @@ class BaseCardConsumer(AsyncJsonWebsocketConsumer, ABC):
             # forward arbitrary messages into last_message; handler may inspect context if needed
             self.last_message = content
 
+    def _add_subscription(
+        self, sid: str, topic: str, ack_policy: str, client_info: Dict[str, Any]
+    ) -> None:
+        idx = self._sub_index.get(sid)
+        if idx is None:
+            self._sub_index[sid] = len(self._sub_ids)
+            self._sub_ids.append(sid)
+            self._sub_topics.append(topic)
+            self._sub_ack.append(ack_policy)
+            self._sub_client.append(client_info)
+        else:
+            # re-subscribe replaces the entry in place
+            if self._sub_ack[idx] == "manual":
+                self._manual_ack_count -= 1
+            self._sub_topics[idx] = topic
+            self._sub_ack[idx] = ack_policy
+            self._sub_client[idx] = client_info
+        if ack_policy == "manual":
+            self._manual_ack_count += 1
+
+    def _remove_subscription(self, sid: Any) -> bool:
+        """Swap-pop `sid` out of the subscription arrays; returns False if unknown."""
+        idx = self._sub_index.pop(sid, None)
+        if idx is None:
+            return False
+        if self._sub_ack[idx] == "manual":
+            self._manual_ack_count -= 1
+        last = len(self._sub_ids) - 1
+        if idx != last:
+            moved = self._sub_ids[last]
+            self._sub_ids[idx] = moved
+            self._sub_topics[idx] = self._sub_topics[last]
+            self._sub_ack[idx] = self._sub_ack[last]
+            self._sub_client[idx] = self._sub_client[last]
+            self._sub_index[moved] = idx
+        self._sub_ids.pop()
+        self._sub_topics.pop()
+        self._sub_ack.pop()
+        self._sub_client.pop()
+        return True
+
     async def _run_handler(self):
         """
         Run the user handler and send validated messages to client.
         """
         try:
-            ctx = {
-                "websocket": self,
-                "params": self.params,
-                "filters": self.params.get("filters"),
-                "active_subscriptions": self.active_subscriptions,
-            }
-            result = self.handle(ctx)
-            if asyncio.iscoroutine(result):
-                result = await result
-            if result is None:
-                return
-            async_iter = _ensure_async_iter(result)
+            ctx = HandlerCtx(self, self.params, self.params.get("filters"), self.active_subscriptions)
+            if self.legacy_handler_shapes:
+                result = self.handle(ctx)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                if result is None:
+                    return
+                async_iter = _ensure_async_iter(result)
+            else:
+                async_iter = self.handle(ctx)
             async for item in async_iter:
+                if self.batch_enabled:
+                    # raw item; the writer wraps it when draining
+                    self._outq.append((item, False))
+                    self._wake_writer()
+                    if len(self._outq) >= self.batch_max_pending:
+                        await self._wait_outq_space()
+                    continue
                 message = {
                     "data": item,
                     "timestamp": _now_iso(),
-                    "subscriptionIds": list(self.active_subscriptions.keys()),
+                    "subscriptionIds": self._sub_ids.copy(),
                 }
-                if any(s.get("ackPolicy") == "manual" for s in self.active_subscriptions.values()):
-                    message["id"] = f"msg-{id(self)}-{int(asyncio.get_event_loop().time() * 1000)}"
+                if self._manual_ack_count:
+                    self._msg_seq += 1
+                    message["id"] = f"msg-{id(self)}-{self._msg_seq}"
                 await self._send_validated(message)
         except Exception as e:
-            await self.send_json(
-                {"action": "error", "message": f"Handler error: {str(e)}", "timestamp": _now_iso()}
-            )
+            error = {"action": "error", "message": f"Handler error: {str(e)}", "timestamp": _now_iso()}
+            if self.batch_enabled:
+                # keep the error behind records still queued for the writer
+                self._outq.append((error, True))
+                self._wake_writer()
+            else:
+                await self.send_json(error)
 
-    async def _send_validated(self, message: Dict[str, Any]):
+    def _wake_writer(self) -> None:
+        wake = self._outq_wake
+        if wake is not None and not wake.done():
+            wake.set_result(None)
+
+    async def _wait_outq_space(self) -> None:
+        """Pause the handler until the writer has drained the queue (backpressure)."""
+        space = self._outq_space = self._loop.create_future()
+        try:
+            await space
+        finally:
+            self._outq_space = None
+
+    def _release_handler(self) -> None:
+        space = self._outq_space
+        if space is not None and not space.done():
+            space.set_result(None)
+
+    async def _writer_loop(self):
         """
-        Validate outgoing message with DRF `response_serializer` (if present) and send.
-        Honors `stream_error_policy`.
+        Single consumer of `_outq`: sleep until woken, then drain the queue.
         """
-        if self.response_serializer is None:
-            await self.send_json(message)
+        try:
+            while True:
+                if not self._outq:
+                    self._outq_wake = self._loop.create_future()
+                    await self._outq_wake
+                    self._outq_wake = None
+                await self._drain_outq()
+                self._release_handler()
+        except asyncio.CancelledError:
             return
+        finally:
+            # never leave the handler parked on a writer that has stopped
+            self._release_handler()
+
+    async def _drain_outq(self):
+        """
+        Send queued records as `batch` frames of up to `batch_max_size` items.
+        Control frames (errors) flush the pending batch and are sent as-is.
 
+        Records drained together share one `timestamp` string and one `subscriptionIds`
+        tuple; neither is mutated by validation or encoding.
+        """
+        items: List[Dict[str, Any]] = []
+        iso = _now_iso()
+        sub_ids = tuple(self._sub_ids)
+        while self._outq:
+            payload, is_control = self._outq.popleft()
+            if is_control:
+                if items:
+                    await self.send_json({"action": "batch", "items": items})
+                    items = []
+                await self.send_json(payload)
+                continue
+            message = {"data": payload, "timestamp": iso, "subscriptionIds": sub_ids}
+            if self._manual_ack_count:
+                self._msg_seq += 1
+                message["id"] = f"msg-{id(self)}-{self._msg_seq}"
+            try:
+                items.append(self._render_message(message))
+            except serializers.ValidationError as ve:
+                if self.stream_error_policy == "fail":
+                    if items:
+                        await self.send_json({"action": "batch", "items": items})
+                    self._outq.clear()
+                    await self.send_json(
+                        {"action": "error", "message": str(ve), "timestamp": _now_iso()}
+                    )
+                    await self.close()
+                    return
+                if self.stream_error_policy == "log":
+                    items.append(
+                        {"action": "error", "__validation_error": ve.detail, "timestamp": _now_iso()}
+                    )
+            if len(items) >= self.batch_max_size:
+                await self.send_json({"action": "batch", "items": items})
+                items = []
+        if items:
+            await self.send_json({"action": "batch", "items": items})
+
+    def _render_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate `message` with `response_serializer` (if present) and return the payload to send.
+        Raises `serializers.ValidationError` on invalid messages.
+        """
+        serializer_cls = self.response_serializer
+        if serializer_cls is None:
+            return message
+        if issubclass(serializer_cls, BaseCardRecordSerializer):
+            # reuse the class's compiled validator plan instead of a serializer per message
+            ser, _ = serializer_cls._get_compiled_plan()
+            return ser.to_record(ser.fast_validate(message))
+        ser = serializer_cls(data=message)
+        ser.is_valid(raise_exception=True)
+        # If serializer has `to_record`, prefer its output, else use representation
+        if hasattr(ser, "to_record"):
+            return ser.to_record()
+        return ser.data
+
+    async def _send_validated_impl(self, message: Dict[str, Any]):
+        """
+        Validate outgoing message with DRF `response_serializer` and send.
+        Honors `stream_error_policy`. Bound as `_send_validated` in `connect` when a
+        serializer is configured; otherwise `_send_validated` is `send_json`.
+        """
         try:
-            serializer_cls = self.response_serializer
-            ser = serializer_cls(data=message)
-            ser.is_valid(raise_exception=True)
-            # If serializer has `to_record`, prefer its output, else use representation
-            if hasattr(ser, "to_record"):
-                out = ser.to_record()
-            else:
-                out = ser.data
+            out = self._render_message(message)
             await self.send_json(out)
         except serializers.ValidationError as ve:
             if self.stream_error_policy == "fail":
@@ -1,14 +1,34 @@
 # cereon_sdk/django/serializers.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from rest_framework.fields import SkipField, empty, get_error_detail
+from rest_framework.serializers import as_serializer_error
+
+from .utils import _json_dumps
+
+# (field_name, source_attrs, field.run_validation, validate_<field_name> hook or None)
+_PlanStep = Tuple[str, List[str], Callable[[Any], Any], Optional[Callable[[Any], Any]]]
 
 
 # ---------------------------------------------------------------------------
 # Core serializers
 # ---------------------------------------------------------------------------
-class QueryMetadataSerializer(serializers.Serializer):
+class _SlottedSerializer(serializers.Serializer):
+    """
+    Common root that stores DRF's per-instance serializer state in slots.
+
+    DRF fields still carry a `__dict__`, but the attributes set on every validation /
+    render no longer grow it. Keeping the slots on a single root lets the SDK serializers
+    be combined through multiple inheritance without instance layout conflicts.
+    """
+
+    __slots__ = ("instance", "initial_data", "_validated_data", "_errors", "_data", "_context")
+
+
+class QueryMetadataSerializer(_SlottedSerializer):
     """
     Generic query/card metadata. Allows arbitrary extra fields.
     Mirrors pydantic.Config(extra="allow") by accepting an open JSON object.
@@ -37,7 +57,42 @@ class QueryMetadataSerializer(serializers.Serializer):
         raise serializers.ValidationError("QueryMetadata must be a mapping")
 
 
-class BaseCardRecordSerializer(serializers.Serializer):
+class BaseCardDataSerializer(_SlottedSerializer):
+    """
+    Base for `data_serializer_class` payload serializers.
+
+    At class definition a render plan is derived from the declared fields so that
+    `_render_data_fast` can render a dict payload without instantiating the serializer:
+    required keys are copied, nullable keys default to None and other optional keys are
+    copied only when present. Values are passed through without field coercion.
+    """
+
+    # (field_name, mode) with mode 0=required, 1=nullable (default None), 2=optional
+    _render_plan: ClassVar[Tuple[Tuple[str, int], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._render_plan = tuple(
+            (name, 0 if field.required else 1 if field.allow_null else 2)
+            for name, field in cls._declared_fields.items()
+            if not field.write_only
+        )
+
+    @classmethod
+    def _render_data_fast(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Render `data` following `_render_plan`; raises KeyError on a missing required key."""
+        out: Dict[str, Any] = {}
+        for name, mode in cls._render_plan:
+            if mode == 0:
+                out[name] = data[name]
+            elif mode == 1:
+                out[name] = data.get(name)
+            elif name in data:
+                out[name] = data[name]
+        return out
+
+
+class BaseCardRecordSerializer(_SlottedSerializer):
     """
     Generic wrapper for dashboard card records.
 
@@ -53,29 +108,126 @@ class BaseCardRecordSerializer(serializers.Serializer):
     """
 
     kind = serializers.CharField()
-    report_id = serializers.CharField(source="report_id", required=True)
-    card_id = serializers.CharField(source="card_id", required=True)
+    report_id = serializers.CharField(required=True)
+    card_id = serializers.CharField(required=True)
     data = serializers.JSONField(required=False, allow_null=True)
     meta = QueryMetadataSerializer(required=False, allow_null=True)
 
     # Allow subclasses to supply a DRF Serializer class used to validate/serialize `data`
     data_serializer_class: Optional[Type[serializers.Serializer]] = None
 
+    # Render dict `data` through `BaseCardDataSerializer._render_data_fast` (no per-message
+    # serializer). Set False where DRF field coercion on output must be exact.
+    _fast_render: ClassVar[bool] = True
+
+    # `kind` filled in when the payload omits it (None => `kind` is required)
+    _default_kind: ClassVar[Optional[str]] = None
+
+    # camelCase keys accepted from external clients -> snake_case keys used internally
+    _key_aliases: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("cardId", "card_id"),
+        ("reportId", "report_id"),
+    )
+    _alias_map: ClassVar[Dict[str, str]] = dict(_key_aliases)
+
+    # (probe serializer, field steps) compiled once per subclass; see `fast_validate`
+    _compiled_plan: ClassVar[
+        Optional[Tuple["BaseCardRecordSerializer", Tuple[_PlanStep, ...]]]
+    ] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # never share a parent's bound fields; each subclass compiles its own plan lazily
+        cls._compiled_plan = None
+        cls._alias_map = dict(cls._key_aliases)
+
+    @classmethod
+    def _get_compiled_plan(cls) -> Tuple["BaseCardRecordSerializer", Tuple[_PlanStep, ...]]:
+        """
+        Build (once) a flat tuple of bound field validators from a probe instance so
+        repeated validation skips `Serializer.__init__` and bound-field discovery.
+        """
+        plan = cls._compiled_plan
+        if plan is None:
+            probe = cls()
+            steps = tuple(
+                (
+                    field.field_name,
+                    field.source_attrs,
+                    field.run_validation,
+                    getattr(probe, "validate_" + field.field_name, None),
+                )
+                for field in probe._writable_fields
+            )
+            plan = cls._compiled_plan = (probe, steps)
+        return plan
+
+    def fast_validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Equivalent of `is_valid(raise_exception=True)` + `validated_data` for `data`,
+        run through the class's compiled plan instead of a fresh serializer instance.
+
+        Subclasses overriding `to_internal_value` fall back to the regular DRF path.
+        """
+        cls = type(self)
+        if cls.to_internal_value is not BaseCardRecordSerializer.to_internal_value:
+            ser = cls(data=data, context=self._context)
+            ser.is_valid(raise_exception=True)
+            return ser.validated_data
+
+        probe, steps = cls._get_compiled_plan()
+        normalized = self._normalize_record(data)
+        ret: Dict[str, Any] = {}
+        errors: Dict[str, Any] = {}
+        for name, source_attrs, run_validation, validate_hook in steps:
+            try:
+                value = run_validation(normalized.get(name, empty))
+                if validate_hook is not None:
+                    value = validate_hook(value)
+            except serializers.ValidationError as exc:
+                errors[name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[name] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                probe.set_value(ret, source_attrs, value)
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        try:
+            probe.run_validators(ret)
+            ret = probe.validate(ret)
+        except (serializers.ValidationError, DjangoValidationError) as exc:
+            raise serializers.ValidationError(detail=as_serializer_error(exc))
+        return ret
+
     def to_internal_value(self, data: Any) -> Dict[str, Any]:
         """
         Validate incoming payload. If `data_serializer_class` provided, validate `data` using it.
         Accepts both camelCase keys from external clients or snake_case keys.
         """
+        # Run base field validation
+        return super().to_internal_value(self._normalize_record(data))
+
+    def _normalize_record(self, data: Any) -> Dict[str, Any]:
+        """
+        Rewrite camelCase keys and validate nested `meta`/`data` ahead of field validation.
+        """
         if not isinstance(data, dict):
             raise serializers.ValidationError("Record payload must be an object")
 
-        # Normalize camelCase keys to snake_case used internally
-        normalized = dict(data)
-        # support client sending cardId/reportId
-        if "cardId" in normalized and "card_id" not in normalized:
-            normalized["card_id"] = normalized.pop("cardId")
-        if "reportId" in normalized and "report_id" not in normalized:
-            normalized["report_id"] = normalized.pop("reportId")
+        # Normalize camelCase keys to snake_case in a single pass using `_key_aliases`;
+        # an explicit snake_case key always wins over its camelCase alias.
+        aliases = self._alias_map
+        normalized: Dict[str, Any] = {}
+        for key, value in data.items():
+            alias = aliases.get(key)
+            if alias is not None and alias not in data:
+                key = alias
+            normalized[key] = value
+        if self._default_kind is not None and "kind" not in normalized:
+            normalized["kind"] = self._default_kind
 
         # Validate meta using QueryMetadataSerializer if present
         meta = normalized.get("meta")
@@ -90,9 +242,7 @@ class BaseCardRecordSerializer(serializers.Serializer):
             nested.is_valid(raise_exception=True)
             normalized["data"] = nested.validated_data
 
-        # Run base field validation
-        ret = super().to_internal_value(normalized)
-        return ret
+        return normalized
 
     def to_representation(self, instance: Any) -> Dict[str, Any]:
         """
@@ -114,24 +264,36 @@ class BaseCardRecordSerializer(serializers.Serializer):
                 out["meta"] = meta
 
         # Render nested data using data_serializer_class if provided
-        if self.data_serializer_class and out.get("data") is not None:
+        data_cls = self.data_serializer_class
+        if data_cls and out.get("data") is not None:
             try:
-                ser = self.data_serializer_class(out["data"])
-                out["data"] = ser.data
+                data = out["data"]
+                if (
+                    self._fast_render
+                    and isinstance(data, dict)
+                    and issubclass(data_cls, BaseCardDataSerializer)
+                ):
+                    out["data"] = data_cls._render_data_fast(data)
+                else:
+                    ser = data_cls(data)
+                    out["data"] = ser.data
             except Exception:
                 pass
 
         # Keep canonical snake_case internally but also provide flattened record via to_record
         return out
 
-    def to_record(self) -> Dict[str, Any]:
+    def to_record(self, validated: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Flatten to a record dict resembling original pydantic `.to_record()`:
           - includes kind
           - meta JSON-stringified if present
           - merges data dict into top-level (if data is mapping)
+
+        `validated` may be passed explicitly (e.g. the output of `fast_validate`).
         """
-        validated = getattr(self, "validated_data", None)
+        if validated is None:
+            validated = getattr(self, "validated_data", None)
         if validated is None:
             # if serializer not validated, fallback to serialized representation
             validated = self.data if hasattr(self, "data") else {}
@@ -152,9 +314,7 @@ class BaseCardRecordSerializer(serializers.Serializer):
         if meta is not None:
             # meta should be a dict -> JSON string
             try:
-                import json
-
-                base["meta"] = json.dumps(meta)
+                base["meta"] = _json_dumps(meta)
             except Exception:
                 base["meta"] = str(meta)
 
@@ -171,7 +331,7 @@ class BaseCardRecordSerializer(serializers.Serializer):
 # ---------------------------------------------------------------------------
 # Chart models
 # ---------------------------------------------------------------------------
-class ChartCardDataSerializer(serializers.Serializer):
+class ChartCardDataSerializer(BaseCardDataSerializer):
     data = serializers.ListField(child=serializers.DictField(child=serializers.JSONField()))
 
 
@@ -182,7 +342,7 @@ class ChartCardRecordSerializer(BaseCardRecordSerializer):
 # ---------------------------------------------------------------------------
 # Table models
 # ---------------------------------------------------------------------------
-class TableCardDataSerializer(serializers.Serializer):
+class TableCardDataSerializer(BaseCardDataSerializer):
     rows = serializers.ListField(child=serializers.DictField(child=serializers.JSONField()))
     columns = serializers.ListField(child=serializers.CharField())
     totalCount = serializers.IntegerField(required=False, allow_null=True)
@@ -197,19 +357,13 @@ class TableCardDataSerializer(serializers.Serializer):
 
 class TableCardRecordSerializer(BaseCardRecordSerializer):
     data_serializer_class = TableCardDataSerializer
-
-    def to_internal_value(self, data: Any) -> Dict[str, Any]:
-        # Ensure 'kind' default for Table is "table" if not provided
-        if isinstance(data, dict) and "kind" not in data:
-            data = dict(data)
-            data["kind"] = "table"
-        return super().to_internal_value(data)
+    _default_kind = "table"
 
 
 # ---------------------------------------------------------------------------
 # Number / KPI models
 # ---------------------------------------------------------------------------
-class NumberCardDataSerializer(serializers.Serializer):
+class NumberCardDataSerializer(BaseCardDataSerializer):
     value = serializers.FloatField()
     previousValue = serializers.FloatField(required=False, allow_null=True)
     trend = serializers.ChoiceField(
@@ -235,19 +389,13 @@ class NumberCardMetadataSerializer(QueryMetadataSerializer):
 class NumberCardRecordSerializer(BaseCardRecordSerializer):
     data_serializer_class = NumberCardDataSerializer
     meta = NumberCardMetadataSerializer(required=False, allow_null=True)
-
-    def to_internal_value(self, data: Any) -> Dict[str, Any]:
-        # enforce default kind if missing
-        if isinstance(data, dict) and "kind" not in data:
-            data = dict(data)
-            data["kind"] = "number"
-        return super().to_internal_value(data)
+    _default_kind = "number"
 
 
 # ---------------------------------------------------------------------------
 # Html models
 # ---------------------------------------------------------------------------
-class HtmlCardDataSerializer(serializers.Serializer):
+class HtmlCardDataSerializer(BaseCardDataSerializer):
     content = serializers.CharField(required=False, allow_null=True)
     rawHtml = serializers.CharField(required=False, allow_null=True)
     styles = serializers.CharField(required=False, allow_null=True)
@@ -255,18 +403,13 @@ class HtmlCardDataSerializer(serializers.Serializer):
 
 class HtmlCardRecordSerializer(BaseCardRecordSerializer):
     data_serializer_class = HtmlCardDataSerializer
-
-    def to_internal_value(self, data: Any) -> Dict[str, Any]:
-        if isinstance(data, dict) and "kind" not in data:
-            data = dict(data)
-            data["kind"] = "html"
-        return super().to_internal_value(data)
+    _default_kind = "html"
 
 
 # ---------------------------------------------------------------------------
 # Iframe models
 # ---------------------------------------------------------------------------
-class IframeCardDataSerializer(serializers.Serializer):
+class IframeCardDataSerializer(BaseCardDataSerializer):
     url = serializers.CharField()
     title = serializers.CharField(required=False, allow_null=True)
     width = serializers.CharField(required=False, allow_null=True)
@@ -286,18 +429,13 @@ class IframeCardDataSerializer(serializers.Serializer):
 
 class IframeCardRecordSerializer(BaseCardRecordSerializer):
     data_serializer_class = IframeCardDataSerializer
-
-    def to_internal_value(self, data: Any) -> Dict[str, Any]:
-        if isinstance(data, dict) and "kind" not in data:
-            data = dict(data)
-            data["kind"] = "iframe"
-        return super().to_internal_value(data)
+    _default_kind = "iframe"
 
 
 # ---------------------------------------------------------------------------
 # Markdown models
 # ---------------------------------------------------------------------------
-class MarkdownCardDataSerializer(serializers.Serializer):
+class MarkdownCardDataSerializer(BaseCardDataSerializer):
     content = serializers.CharField(required=False, allow_null=True)
     rawMarkdown = serializers.CharField(required=False, allow_null=True)
     styles = serializers.CharField(required=False, allow_null=True)
@@ -305,9 +443,4 @@ class MarkdownCardDataSerializer(serializers.Serializer):
 
 class MarkdownCardRecordSerializer(BaseCardRecordSerializer):
     data_serializer_class = MarkdownCardDataSerializer
-
-    def to_internal_value(self, data: Any) -> Dict[str, Any]:
-        if isinstance(data, dict) and "kind" not in data:
-            data = dict(data)
-            data["kind"] = "markdown"
-        return super().to_internal_value(data)
+    _default_kind = "markdown"
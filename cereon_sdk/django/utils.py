@@ -1,6 +1,8 @@
 # cereon_sdk/django/utils.py
 from __future__ import annotations
+import functools
 import json
+import re
 import urllib.parse
 from typing import Any, Dict, Optional, Union
 
@@ -8,37 +10,129 @@ from asgiref.typing import Scope
 from django.core.exceptions import BadRequest
 from django.http import HttpRequest, QueryDict
 from rest_framework.request import Request as DRFRequest
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
 
+from .._json import json_dumps as _json_dumps, json_loads as _json_loads, orjson
+from .._numbers import coerce_num as _coerce_num
 
-def _maybe_decode_json_str(value: Any) -> Any:
+
+def _escape_line_separators(body: bytes) -> bytes:
+    """Escape U+2028/U+2029 as JSONRenderer does (they are invalid in JavaScript strings)."""
+    # both encode as e2 80 a8 / e2 80 a9; bodies without that prefix skip the replaces
+    if b"\xe2\x80" not in body:
+        return body
+    return body.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+def _json_render_stdlib(obj: Any) -> bytes:
     """
-    Same heuristic as FastAPI utils: decode JSON strings or double-encoded JSON.
+    UTF-8 JSON body for validated DRF data, matching JSONRenderer's default settings
+    (Decimal, datetime, UUID, ... as DRF renders; U+2028/U+2029 escaped; NaN rejected).
     """
-    if isinstance(value, str):
-        v = value.strip()
+    text = json.dumps(
+        obj, cls=DRFJSONEncoder, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    )
+    return _escape_line_separators(text.encode("utf-8"))
 
-        for _ in range(3):
-            if v.startswith(("{", "[", '"')) or v in ("true", "false", "null") or (v and v[0].isdigit()):
-                try:
-                    return json.loads(v)
-                except Exception:
-                    if v.startswith('"') and v.endswith('"'):
-                        try:
-                            return json.loads(v[1:-1])
-                        except Exception:
-                            pass
+
+if orjson is not None:
+    # datetimes are passed through so DRF's encoder renders them as JSONRenderer does
+    _drf_default = DRFJSONEncoder().default
+    _DRF_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _json_render(obj: Any) -> bytes:
+        """
+        `_json_render_stdlib` output via orjson. One difference: orjson renders NaN/Infinity
+        as null where JSONRenderer (STRICT_JSON) raises.
+        """
+        try:
+            body = orjson.dumps(obj, default=_drf_default, option=_DRF_OPTS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which JSONRenderer accepts
+            return _json_render_stdlib(obj)
+        return _escape_line_separators(body)
+
+else:
+    _json_render = _json_render_stdlib
+
+
+# JSON candidate: object/array/string opener, literal, or (signed) number
+_JSON_CANDIDATE = re.compile(r'\s*(?:[{\["]|true|false|null|-?\d)')
+
+# raw str -> text that decoded as JSON (None => not JSON); bounded FIFO so the same
+# `params=` value across reconnects skips the unquote/retry ladder. Only the text is
+# cached: decoding it again hands every caller its own mutable objects.
+_JSON_TEXT_CACHE: Dict[str, Optional[str]] = {}
+_JSON_TEXT_CACHE_SIZE = 128
+
+
+def _decode_json_text(value: str) -> Any:
+    """Return `(text, decoded)` for the first form of `value` that parses as JSON, or `(None, value)`."""
+    v = value.strip()
+    for _ in range(3):
+        if _JSON_CANDIDATE.match(v):
             try:
-                v_unq = urllib.parse.unquote_plus(v)
+                return v, _json_loads(v)
             except Exception:
-                break
-            if v_unq == v:
-                break
-            v = v_unq
+                if v.startswith('"') and v.endswith('"'):
+                    try:
+                        return v[1:-1], _json_loads(v[1:-1])
+                    except Exception:
+                        pass
         try:
-            return json.loads(v)
+            v_unq = urllib.parse.unquote_plus(v)
         except Exception:
-            return value
-    return value
+            break
+        if v_unq == v:
+            break
+        v = v_unq
+    try:
+        return v, _json_loads(v)
+    except Exception:
+        return None, value
+
+
+def _maybe_decode_json_str(value: Any) -> Any:
+    """
+    Same heuristic as FastAPI utils: decode JSON strings or double-encoded JSON.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        text = _JSON_TEXT_CACHE[value]
+    except KeyError:
+        pass
+    else:
+        return value if text is None else _json_loads(text)
+
+    text, decoded = _decode_json_text(value)
+    if len(_JSON_TEXT_CACHE) >= _JSON_TEXT_CACHE_SIZE:
+        del _JSON_TEXT_CACHE[next(iter(_JSON_TEXT_CACHE))]
+    _JSON_TEXT_CACHE[value] = text
+    return decoded
+
+
+def _parse_qs_flat(qs: str) -> Dict[str, Any]:
+    """
+    Single-pass equivalent of `parse_qs(qs, keep_blank_values=True)` + flattening.
+
+    The first value of a key is stored as a plain string; a repeated key is promoted
+    to a list of all its values.
+    """
+    parsed: Dict[str, Any] = {}
+    for pair in qs.split("&"):
+        if not pair:
+            continue
+        k, _, v = pair.partition("=")
+        k = urllib.parse.unquote_plus(k)
+        v = urllib.parse.unquote_plus(v)
+        if k not in parsed:
+            parsed[k] = v
+        elif isinstance(parsed[k], list):
+            parsed[k].append(v)
+        else:
+            parsed[k] = [parsed[k], v]
+    return parsed
 
 
 def _normalize_querydict(qs: Union[str, bytes, QueryDict]) -> Dict[str, Any]:
@@ -48,19 +142,57 @@ def _normalize_querydict(qs: Union[str, bytes, QueryDict]) -> Dict[str, Any]:
     if isinstance(qs, (bytes, bytearray)):
         qs = qs.decode("utf-8")
     if isinstance(qs, str):
-        parsed = urllib.parse.parse_qs(qs, keep_blank_values=True)
-    else:  # QueryDict (DRF/Django)
-        parsed = {}
-        for k in qs:
-            v = qs.getlist(k)
-            parsed[k] = v
-    normalized: Dict[str, Any] = {}
-    for k, v in parsed.items():
-        if isinstance(v, list) and len(v) == 1:
-            normalized[k] = v[0]
-        else:
-            normalized[k] = v
-    return normalized
+        return _parse_qs_flat(qs)
+    # QueryDict (DRF/Django): lists() yields each key's value list in one pass
+    return {k: v[0] if len(v) == 1 else v for k, v in qs.lists()}
+
+
+def _decode_query_params_value(raw: Any) -> Dict[str, Any]:
+    """Decode the querystring 'params' value; raise BadRequest on parse errors."""
+    try:
+        decoded = _maybe_decode_json_str(raw)
+        # unwrap accidental nested {"params": {...}}
+        if isinstance(decoded, dict) and "params" in decoded and isinstance(decoded["params"], dict):
+            return decoded["params"]
+        if isinstance(decoded, dict):
+            return decoded
+        return {"params": decoded}
+    except Exception as e:
+        raise BadRequest(f"Invalid JSON in query param 'params': {e}")
+
+
+def _parse_query_params(qs: str) -> Dict[str, Any]:
+    """
+    Querystring half of `parse_http_params`: top-level 'params' (JSON-decoded) or the flat query dict.
+    """
+    normalized_query = _normalize_querydict(qs)
+    if "params" in normalized_query:
+        return _decode_query_params_value(normalized_query["params"])
+    return normalized_query
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_params_blob(qs: str) -> Optional[str]:
+    """JSON text of `_parse_query_params(qs)`, or None when the result does not round-trip."""
+    params = _parse_query_params(qs)
+    try:
+        # stdlib text: orjson would write NaN/Infinity as null and not decode back
+        return json.dumps(params, allow_nan=True)
+    except Exception:
+        return None
+
+
+def parse_query_params_cached(qs: str) -> Dict[str, Any]:
+    """
+    `_parse_query_params` memoized on the raw querystring, for body-less (GET) requests.
+
+    The cache holds the parsed result as JSON text and decodes it per call, so every
+    request still gets its own mutable dict. Parse errors (BadRequest) are not cached.
+    """
+    blob = _query_params_blob(qs)
+    if blob is None:
+        return _parse_query_params(qs)
+    return _json_loads(blob)
 
 
 async def parse_http_params(request: Union[DRFRequest, HttpRequest]) -> Dict[str, Any]:
@@ -81,16 +213,7 @@ async def parse_http_params(request: Union[DRFRequest, HttpRequest]) -> Dict[str
 
     # If params in querystring
     if "params" in normalized_query:
-        try:
-            decoded = _maybe_decode_json_str(normalized_query["params"])
-            # unwrap accidental nested {"params": {...}}
-            if isinstance(decoded, dict) and "params" in decoded and isinstance(decoded["params"], dict):
-                return decoded["params"]
-            if isinstance(decoded, dict):
-                return decoded
-            return {"params": decoded}
-        except Exception as e:
-            raise BadRequest(f"Invalid JSON in query param 'params': {e}")
+        return _decode_query_params_value(normalized_query["params"])
 
     # For mutating methods, try reading body
     method = getattr(request, "method", "GET").upper()
@@ -103,8 +226,7 @@ async def parse_http_params(request: Union[DRFRequest, HttpRequest]) -> Dict[str
                 try:
                     body_raw = request.body  # may be bytes
                     if body_raw:
-                        decoded = body_raw.decode("utf-8")
-                        data = json.loads(decoded)
+                        data = _json_loads(body_raw)
                     else:
                         data = {}
                 except Exception:
@@ -131,15 +253,33 @@ async def parse_http_params(request: Union[DRFRequest, HttpRequest]) -> Dict[str
     return normalized_query
 
 
+# websocket payload keys mapped from the querystring
+_MAPPING_KEY_SET = frozenset(
+    (
+        "url",
+        "topic",
+        "resumeSeq",
+        "subscriptionId",
+        "ackPolicy",
+        "compression",
+        "protocols",
+        "reconnectDelay",
+        "maxReconnectAttempts",
+        "heartbeatInterval",
+    )
+)
+# mapped keys coerced to numbers
+_INT_KEYS = frozenset(("resumeSeq", "reconnectDelay", "maxReconnectAttempts", "heartbeatInterval"))
+
+
 async def parse_websocket_params_from_scope(scope: Scope, initial_message: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse websocket params from ASGI scope['query_string'] (Channels scope).
     If `initial_message` provided use that as received initial payload (already decoded).
     Mirrors the FastAPI websocket parser.
     """
-    qs_bytes = scope.get("query_string", b"")
-    qs = qs_bytes.decode("utf-8") if isinstance(qs_bytes, (bytes, bytearray)) else str(qs_bytes)
-    query = urllib.parse.parse_qs(qs, keep_blank_values=True)
+    # ASGI guarantees `query_string` is bytes
+    query = _parse_qs_flat(scope.get("query_string", b"").decode("utf-8"))
 
     def _single(v):
         return v[0] if isinstance(v, list) and v else v
@@ -153,37 +293,14 @@ async def parse_websocket_params_from_scope(scope: Scope, initial_message: Optio
             return decoded
         return {"params": decoded}
 
-    mapping_keys = [
-        "url",
-        "topic",
-        "resumeSeq",
-        "subscriptionId",
-        "ackPolicy",
-        "compression",
-        "protocols",
-        "reconnectDelay",
-        "maxReconnectAttempts",
-        "heartbeatInterval",
-    ]
-    for key in mapping_keys:
-        if key in query:
-            v = _single(query[key])
-            if key in ("resumeSeq", "reconnectDelay", "maxReconnectAttempts", "heartbeatInterval"):
-                try:
-                    payload[key] = int(v)
-                except Exception:
-                    try:
-                        payload[key] = float(v)
-                    except Exception:
-                        payload[key] = v
-            else:
-                payload[key] = _maybe_decode_json_str(v)
-
-    # headers.<name> support
+    # one pass: mapped websocket keys and `headers.<name>` support
     headers = {}
     for qk, qv in query.items():
-        if qk.startswith("headers.") and qv:
-            headers[qk.split(".", 1)[1]] = _single(qv)
+        if qk in _MAPPING_KEY_SET:
+            v = _single(qv)
+            payload[qk] = _coerce_num(v) if qk in _INT_KEYS else _maybe_decode_json_str(v)
+        elif qk.startswith("headers."):
+            headers[qk[8:]] = _single(qv)
     if headers:
         payload["headers"] = headers
 
@@ -193,7 +310,7 @@ async def parse_websocket_params_from_scope(scope: Scope, initial_message: Optio
     # fallback to initial_message if provided
     if initial_message:
         try:
-            parsed = json.loads(initial_message)
+            parsed = _json_loads(initial_message)
         except Exception:
             return {"initialMessage": initial_message}
         if isinstance(parsed, dict):
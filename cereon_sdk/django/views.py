@@ -1,18 +1,60 @@
 # cereon_sdk/django/views.py
 from __future__ import annotations
-import asyncio
-from typing import Any, Dict, Iterable, List, Optional, Type, Union, Callable
+import functools
+import inspect
+from collections.abc import Iterable as AbcIterable
+from types import GeneratorType
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple, Type, Union, Callable
 
-from abc import ABC, abstractmethod
+from asgiref.sync import sync_to_async
+from django.core.exceptions import BadRequest, PermissionDenied
+from django.http import HttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, serializers
 from rest_framework.request import Request as DRFRequest
+from rest_framework.settings import api_settings
 
-from .utils import parse_http_params
+from .utils import _json_render, parse_http_params, parse_query_params_cached
 
 RecordSerializer = Type[serializers.Serializer]
 
+# result types dispatched by a set lookup on `type(result)` before any ABC probe
+_SEQ_TYPES = frozenset((list, tuple))
+_SCALAR_TYPES = frozenset((str, bytes, dict, int, float, bool, type(None)))
+
+# exception type (exact) -> response status; anything unlisted is a 500
+_ERROR_STATUS: Dict[type, int] = {
+    BadRequest: status.HTTP_400_BAD_REQUEST,
+    PermissionDenied: status.HTTP_403_FORBIDDEN,
+    PermissionError: status.HTTP_403_FORBIDDEN,
+}
+
+
+def _filters_from(d: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """`d["filters"]`, else `d["params"]["filters"]`, else a non-empty `d["params"]`."""
+    # EAFP: view/route contexts always carry these keys, so the lookups rarely miss
+    try:
+        filters = d["filters"]
+        if isinstance(filters, dict):
+            return filters
+    except KeyError:
+        pass
+    try:
+        params = d["params"]
+    except KeyError:
+        return None
+    if not isinstance(params, dict):
+        return None
+    try:
+        filters = params["filters"]
+        if isinstance(filters, dict):
+            return filters
+    except KeyError:
+        pass
+    # If params is empty, keep searching (nested 'request' dict)
+    return params or None
+
 
 def _get_filters_from_ctx(ctx: Any) -> Optional[Dict[str, Any]]:
     """Normalize and return the filters dict from various ctx shapes used in handlers.
@@ -20,35 +62,89 @@ def _get_filters_from_ctx(ctx: Any) -> Optional[Dict[str, Any]]:
     Mirrors the helper defined in the FastAPI protocols module so handler implementations
     can rely on a predictable `filters` dict regardless of how the view/route constructed ctx.
     """
-    if not ctx:
+    if not ctx or not isinstance(ctx, dict):
         return None
-    if isinstance(ctx, dict):
-        if "filters" in ctx and isinstance(ctx.get("filters"), dict):
-            return ctx.get("filters")
-        if "params" in ctx and isinstance(ctx.get("params"), dict):
-            params = ctx.get("params")
-            if "filters" in params and isinstance(params.get("filters"), dict):
-                return params.get("filters")
-            # If params is empty, prefer checking nested 'request' dict for filters
-            if params:
-                return params
+    filters = _filters_from(ctx)
+    if filters is None:
         req = ctx.get("request")
         if isinstance(req, dict):
-            if "filters" in req and isinstance(req.get("filters"), dict):
-                return req.get("filters")
-            if "params" in req and isinstance(req.get("params"), dict):
-                params = req.get("params")
-                if "filters" in params and isinstance(params.get("filters"), dict):
-                    return params.get("filters")
-                # Only return non-empty params; otherwise continue searching
-                if params:
-                    return params
-    return None
-
-
-class BaseCardAPIView(APIView, ABC):
+            filters = _filters_from(req)
+    return filters
+
+
+@functools.lru_cache(maxsize=256)
+def _get_probe_serializer(
+    serializer_cls: RecordSerializer, many: bool = False
+) -> serializers.BaseSerializer:
+    """
+    Unbound probe instance of `serializer_cls` (its `ListSerializer` when `many`).
+
+    `run_validation` is what `is_valid()` calls under the hood; invoking it on one cached
+    instance skips rebuilding the field tree for every record and request.
+    """
+    return serializer_cls(many=many)
+
+
+def _is_plain_list_serializer(serializer: serializers.BaseSerializer) -> bool:
+    """True for a stock `ListSerializer` whose only work is validating its child per item."""
+    return (
+        type(serializer) is serializers.ListSerializer
+        and serializer.allow_empty
+        and serializer.max_length is None
+        and serializer.min_length is None
+        and not serializer.validators
+    )
+
+
+# `_dispatch` specialized per handler calling convention; `{call}` produces the handler result
+_DISPATCH_SOURCE = """
+async def _dispatch(self, request, *args, **kwargs):
+    try:
+        ctx = await self._get_ctx(request)
+        result = {call}{await_result}
+        return await self._serialize_result(result)
+    except ValidationError as ve:
+        return Response({{"detail": ve.detail}}, status=HTTP_400)
+    except Exception as e:
+        return Response({{"detail": str(e)}}, status=_ERROR_STATUS.get(type(e), HTTP_500))
+"""
+# (handler is async, handler is offloaded) -> handler call expression
+_HANDLER_CALLS: Dict[Tuple[bool, bool], str] = {
+    (True, False): "await self.handle(ctx)",
+    (False, True): "await self._handle_offloaded(self, ctx)",
+    (False, False): "self.handle(ctx)",
+}
+# sync conventions may still hand back an awaitable (see `_call_handler`)
+_AWAIT_RESULT = """
+        if isawaitable(result):
+            result = await result"""
+_specialized_dispatch: Dict[Tuple[bool, bool], Callable[..., Any]] = {}
+
+
+def _build_dispatch(is_async: bool, offload: bool) -> Callable[..., Any]:
+    """Compile (once per calling convention) a `_dispatch` with the handler call inlined."""
+    key = (is_async, offload)
+    fn = _specialized_dispatch.get(key)
+    if fn is None:
+        namespace: Dict[str, Any] = {
+            "Response": Response,
+            "ValidationError": serializers.ValidationError,
+            "_ERROR_STATUS": _ERROR_STATUS,
+            "HTTP_400": status.HTTP_400_BAD_REQUEST,
+            "HTTP_500": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "isawaitable": inspect.isawaitable,
+        }
+        source = _DISPATCH_SOURCE.format(
+            call=_HANDLER_CALLS[key], await_result="" if is_async else _AWAIT_RESULT
+        )
+        exec(compile(source, f"<cereon_sdk dispatch {key}>", "exec"), namespace)
+        fn = _specialized_dispatch[key] = namespace["_dispatch"]
+    return fn
+
+
+class BaseCardAPIView(APIView):
     """
-    Abstract DRF view that implements the 'http' transport contract.
+    Base DRF view that implements the 'http' transport contract.
 
         Subclasses MUST set:
             - response_serializer: DRF Serializer class used to validate responses
@@ -57,9 +153,66 @@ class BaseCardAPIView(APIView, ABC):
                 * Handler may return:
                     - a list/iterable of payloads (will be materialized and validated)
                     - a single payload (will be validated)
+                * A sync `handle` runs in a worker thread via `sync_to_async` so blocking
+                  work (e.g. ORM queries) does not stall the event loop. Set
+                  `handler_is_nonblocking = True` to call it inline instead. Lazy iterables it
+                  returns (generators) are consumed on the event loop.
+
+        Set `trust_handler = True` to skip `response_serializer` validation for handlers whose
+        records are already in the response shape: dict records are returned as-is (no field
+        coercion, no schema enforcement); anything else still goes through the serializer.
     """
 
     response_serializer: Optional[RecordSerializer] = None
+    handler_is_nonblocking: bool = False
+    trust_handler: bool = False
+    # encode successful responses straight to JSON bytes, skipping DRF renderer negotiation;
+    # set False to return a DRF `Response` (e.g. for the browsable API)
+    raw_json_response: bool = True
+    # resolved per subclass in `__init_subclass__`
+    _handler_is_async: ClassVar[bool] = False
+    _handler_offload: ClassVar[bool] = False
+    # class-level `sync_to_async(handle)` wrapper, built once instead of per request
+    _handle_offloaded: ClassVar[Optional[Callable[..., Any]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._handler_is_async = inspect.iscoroutinefunction(cls.handle)
+        cls._handler_offload = not (
+            cls._handler_is_async
+            or inspect.isasyncgenfunction(cls.handle)
+            or cls.handler_is_nonblocking
+        )
+        if cls._handler_offload:
+            # staticmethod: called as `self._handle_offloaded(self, ctx)`, nothing bound per instance
+            cls._handle_offloaded = staticmethod(sync_to_async(cls.handle))
+        # intermediate bases that do not implement `handle` are checked on their concrete subclasses
+        if cls.handle is BaseCardAPIView.handle:
+            return
+        cls._validate_contract()
+        cls._specialize_dispatch()
+
+    @classmethod
+    def _specialize_dispatch(cls) -> None:
+        """
+        Bind a `_dispatch` specialized for this subclass's handler as `get`/`post`.
+        A `get`/`post` overridden by the subclass is left alone; an inherited one (the generic
+        `_dispatch` or a function generated for a parent) is always rebound, so it never
+        inlines a parent's handler convention. Subclasses overriding `_dispatch` or
+        `_call_handler` get their own `_dispatch`.
+        """
+        base = BaseCardAPIView
+        fn = cls._dispatch
+        if fn is base._dispatch and cls._call_handler is base._call_handler:
+            try:
+                fn = _build_dispatch(cls._handler_is_async, cls._handler_offload)
+            except Exception:
+                pass  # generic `_dispatch` stays bound
+        generated = _specialized_dispatch.values()
+        for name in ("get", "post"):
+            current = getattr(cls, name)
+            if current is base._dispatch or current in generated:
+                setattr(cls, name, fn)
 
     @classmethod
     def _get_filters_from_ctx(cls, ctx: Any) -> Optional[Dict[str, Any]]:
@@ -70,7 +223,6 @@ class BaseCardAPIView(APIView, ABC):
         """
         return _get_filters_from_ctx(ctx)
 
-    @abstractmethod
     def handle(self, ctx: Dict[str, Any]) -> Union[List[Any], Iterable[Any], Any]:
         """
         Subclasses must implement `handle(self, ctx)` which may return:
@@ -81,6 +233,7 @@ class BaseCardAPIView(APIView, ABC):
 
     @classmethod
     def _validate_contract(cls) -> None:
+        """Checked once per subclass at class-definition time (see `__init_subclass__`)."""
         if not hasattr(cls, "handle") or not callable(getattr(cls, "handle", None)):
             raise RuntimeError("subclass must implement `handle(self, ctx)` on the view subclass.")
         if cls.response_serializer is None:
@@ -89,8 +242,15 @@ class BaseCardAPIView(APIView, ABC):
             )
 
     async def _call_handler(self, ctx: Dict[str, Any]) -> Any:
-        result = self.handle(ctx)
-        if asyncio.iscoroutine(result):
+        if self._handler_is_async:
+            return await self.handle(ctx)
+        if self._handler_offload:
+            result = await self._handle_offloaded(self, ctx)
+        else:
+            result = self.handle(ctx)
+        # sync `handle` returning an awaitable, or a wrapped async handler that
+        # `iscoroutinefunction` does not recognise
+        if inspect.isawaitable(result):
             return await result
         return result
 
@@ -101,82 +261,118 @@ class BaseCardAPIView(APIView, ABC):
         """
         if self.response_serializer is None:
             return item  # no validation requested
-        serializer_cls = self.response_serializer
-        serializer = serializer_cls(data=item)
-        if not serializer.is_valid():
-            raise serializers.ValidationError(serializer.errors)
-        return serializer.validated_data
+        if self.trust_handler and type(item) is dict:
+            return item
+        return _get_probe_serializer(self.response_serializer).run_validation(item)
+
+    def _validate_many(self, items: List[Any]) -> List[Any]:
+        """
+        Validate a list of items in one `ListSerializer` (`many=True`) pass.
+        Raises `serializers.ValidationError` carrying the per-index errors of every invalid item.
+        """
+        if self.response_serializer is None:
+            return items
+        if self.trust_handler and all(type(x) is dict for x in items):
+            return items
+        return _get_probe_serializer(self.response_serializer, True).run_validation(items)
+
+    async def _validate_stream(self, items: Any, is_async: bool) -> List[Any]:
+        """
+        Validate a sync or async iterable item by item as it is consumed, without first
+        collecting the raw items into a list. Errors are aggregated per index in the same
+        shape `ListSerializer` raises; list serializers with their own length limits or
+        validators get the collected list instead.
+        """
+        if self.response_serializer is None or self.trust_handler:
+            collected = [x async for x in items] if is_async else list(items)
+            return self._validate_many(collected)
+        list_serializer = _get_probe_serializer(self.response_serializer, True)
+        if not _is_plain_list_serializer(list_serializer):
+            collected = [x async for x in items] if is_async else list(items)
+            return list_serializer.run_validation(collected)
+
+        run_validation = list_serializer.child.run_validation
+        validated: List[Any] = []
+        errors: Dict[int, Any] = {}
+        index = 0
+        if is_async:
+            async for x in items:
+                try:
+                    validated.append(run_validation(x))
+                except serializers.ValidationError as exc:
+                    errors[index] = exc.detail
+                index += 1
+        else:
+            for x in items:
+                try:
+                    validated.append(run_validation(x))
+                except serializers.ValidationError as exc:
+                    errors[index] = exc.detail
+                index += 1
+        if errors:
+            if not getattr(api_settings, "LIST_SERIALIZER_ERRORS_AS_DICT", False):
+                errors = [errors.get(i, {}) for i in range(index)]
+            raise serializers.ValidationError(errors)
+        return validated
 
     async def _get_ctx(self, request: DRFRequest) -> Dict[str, Any]:
-        params = await parse_http_params(request._request)
-        if isinstance(params, dict) and "params" in params and isinstance(params["params"], dict):
-            resolved_params = params["params"]
+        http_request = request._request
+        if http_request.method == "GET":
+            # body-less: the result depends only on the raw querystring
+            params = parse_query_params_cached(http_request.META.get("QUERY_STRING", ""))
+        else:
+            params = await parse_http_params(http_request)
+        if type(params) is not dict:
+            resolved_params = {}
         else:
-            resolved_params = params if isinstance(params, dict) else {}
+            inner = params.get("params")
+            resolved_params = inner if type(inner) is dict else params
 
         return {
-            "request": request._request,
+            "request": http_request,
             "params": resolved_params,
             "filters": resolved_params.get("filters"),
         }
 
-    async def get(self, request: DRFRequest, *args, **kwargs):
+    async def _serialize_result(self, result: Any) -> HttpResponse:
         """
-        Handle GET requests. Mirrors FastAPI http handler contract.
+        Materialize iterables into a list of validated records; validate single payloads as-is.
         """
-        self._validate_contract()
-        try:
-            ctx = await self._get_ctx(request)
-            result = await self._call_handler(ctx)
-        except serializers.ValidationError as ve:
-            return Response({"detail": ve.detail}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        # materialize iterables -> list of validated records
-        try:
-            if hasattr(result, "__aiter__") or (
-                isinstance(result, Iterable) and not isinstance(result, (str, bytes, dict))
-            ):
-                if hasattr(result, "__aiter__"):
-                    collected = [x async for x in result]  # type: ignore
-                else:
-                    collected = list(result)
-                validated = [self._validate_item(x) for x in collected]
-                return Response(validated)
+        # concrete-type checks first; the `Iterable` ABC probe is the last resort
+        t = type(result)
+        if t in _SEQ_TYPES:
+            validated = self._validate_many(result if t is list else list(result))
+        elif t in _SCALAR_TYPES:
             validated = self._validate_item(result)
-            return Response(validated)
-        except serializers.ValidationError as ve:
-            return Response({"detail": ve.detail}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        elif t is GeneratorType:
+            validated = await self._validate_stream(result, False)
+        # probe the type, not the instance: one MRO lookup, no instance `__getattr__`
+        elif hasattr(t, "__aiter__"):
+            validated = await self._validate_stream(result, True)
+        # str/bytes/dict subclasses (DRF ReturnDict, OrderedDict, ...) are single payloads
+        elif isinstance(result, (str, bytes, dict)):
+            validated = self._validate_item(result)
+        elif isinstance(result, AbcIterable):
+            validated = await self._validate_stream(result, False)
+        else:
+            validated = self._validate_item(result)
+        if self.raw_json_response:
+            return HttpResponse(_json_render(validated), content_type="application/json")
+        return Response(validated)
 
-    async def post(self, request: DRFRequest, *args, **kwargs):
+    async def _dispatch(self, request: DRFRequest, *args, **kwargs):
         """
-        Handle POST requests mapped to the same contract as GET (body preferred).
+        Handle GET and POST requests. Mirrors FastAPI http handler contract;
+        for POST the request body is preferred over the querystring.
         """
-        self._validate_contract()
         try:
             ctx = await self._get_ctx(request)
             result = await self._call_handler(ctx)
+            return await self._serialize_result(result)
         except serializers.ValidationError as ve:
             return Response({"detail": ve.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            code = _ERROR_STATUS.get(type(e), status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return Response({"detail": str(e)}, status=code)
 
-        try:
-            if hasattr(result, "__aiter__") or (
-                isinstance(result, Iterable) and not isinstance(result, (str, bytes, dict))
-            ):
-                if hasattr(result, "__aiter__"):
-                    collected = [x async for x in result]  # type: ignore
-                else:
-                    collected = list(result)
-                validated = [self._validate_item(x) for x in collected]
-                return Response(validated)
-            validated = self._validate_item(result)
-            return Response(validated)
-        except serializers.ValidationError as ve:
-            return Response({"detail": ve.detail}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    get = post = _dispatch
@@ -0,0 +1,48 @@
+# cereon_sdk/fastapi/_qs_numba.py
+"""
+Optional Numba-compiled percent-decoder for long query-string tokens.
+
+Importing this module raises ImportError when numba/numpy are not installed; callers
+fall back to `urllib.parse.unquote_plus`.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# byte -> hex nibble value, -1 for non-hex bytes
+_HEX_NIBBLE = np.full(256, -1, dtype=np.int16)
+for _i, _c in enumerate(b"0123456789abcdef"):
+    _HEX_NIBBLE[_c] = _i
+for _i, _c in enumerate(b"ABCDEF"):
+    _HEX_NIBBLE[_c] = 10 + _i
+
+
+@njit(cache=True)
+def unquote_to_buf(buf, out, nibble) -> int:
+    """Percent/plus-decode `buf` (uint8) into `out`; returns the decoded length."""
+    n = buf.shape[0]
+    i = 0
+    j = 0
+    while i < n:
+        c = buf[i]
+        if c == 0x2B:  # '+'
+            out[j] = 0x20
+            i += 1
+        elif c == 0x25 and i + 2 < n and nibble[buf[i + 1]] >= 0 and nibble[buf[i + 2]] >= 0:
+            out[j] = nibble[buf[i + 1]] * 16 + nibble[buf[i + 2]]
+            i += 3
+        else:
+            # malformed escapes are kept literally, as `unquote_plus` does
+            out[j] = c
+            i += 1
+        j += 1
+    return j
+
+
+def unquote_plus(value: str) -> str:
+    """Drop-in for `urllib.parse.unquote_plus` (UTF-8, errors='replace')."""
+    raw = value.encode("utf-8")
+    out = np.empty(len(raw), dtype=np.uint8)
+    n = unquote_to_buf(np.frombuffer(raw, dtype=np.uint8), out, _HEX_NIBBLE)
+    return out[:n].tobytes().decode("utf-8", "replace")
@@ -1,52 +1,139 @@
 # cereon_sdk/fastapi/utils.py
-import json
 import logging
-import urllib.parse
-from typing import Any, Dict
+import os
+from urllib.parse import unquote_plus as _unquote_plus
+from typing import Any, Dict, Optional
 
 from fastapi import Request, WebSocket, WebSocketDisconnect, HTTPException
 
+# orjson when installed; accepts str and bytes alike
+from .._json import json_loads as _json_loads
+from .._numbers import FAST_INT_DIGITS as _FAST_INT_DIGITS, coerce_num as _coerce_num
+
+
+# optional Numba percent-decoder for long tokens (`pip install numba`); opt-in because
+# importing numba is slow and each process pays a one-off JIT/cache load
+_unquote_long = None
+if os.environ.get("CEREON_ENABLE_SPEEDUPS") == "1":
+    try:
+        from ._qs_numba import unquote_plus as _unquote_long
+    except ImportError:  # pragma: no cover - stdlib fallback
+        pass
+# tokens longer than this use `_unquote_long` when available (short ones are cheaper in stdlib)
+_LONG_TOKEN = 64
+
 # module logger
 logger = logging.getLogger(__name__)
 
 
+# first-character classes of JSON text; anything else is returned unparsed
+_JSON_LEAD = frozenset('{["')
+_NUM_LEAD = frozenset("-0123456789")
+_JSON_LITERALS = {"true": True, "false": False, "null": None}
+# first characters of values that may decode: JSON leads, literal initials, `NaN` /
+# `Infinity` (accepted by the final decode), and percent/plus-encoding (whitespace is
+# checked separately, it is stripped first)
+_DECODE_LEAD = frozenset('{["-0123456789tfnNI%+')
+
+# content types read through `request.form()`; every other body is tried as JSON
+_FORM_CONTENT_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+
+# methods whose body is parsed for params (ASGI delivers the method uppercase)
+_BODY_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
 def _maybe_decode_json_str(value: Any) -> Any:
     """
     If value is a JSON string (possibly double-encoded), decode it into Python object.
     Otherwise return value unchanged.
     """
-    if isinstance(value, str):
-        v = value.strip()
-
-        # Attempt multiple decode/unquote passes to handle double-encoded values
-        for _ in range(3):
-            # quick heuristic: if it looks like JSON try to parse
-            if v.startswith(("{", "[", '"')) or v in ("true", "false", "null") or (v and v[0].isdigit()):
-                try:
-                    return json.loads(v)
-                except Exception:
-                    # try to strip surrounding quotes then parse
-                    if v.startswith('"') and v.endswith('"'):
-                        v_inner = v[1:-1]
-                        try:
-                            return json.loads(v_inner)
-                        except Exception:
-                            pass
-            # not parsed yet — try unquoting percent-encoding and loop
+    if not isinstance(value, str) or not value:
+        return value
+    # plain ids/urls/topics return after one membership test
+    c0 = value[0]
+    if c0 not in _DECODE_LEAD and not c0.isspace():
+        return value
+    v = value.strip()
+
+    # Attempt up to three decode/unquote passes to handle percent-encoded values
+    for _ in range(3):
+        if not v:
+            return value
+        lead = v[0]
+        if lead in _JSON_LEAD:
             try:
-                v_unq = urllib.parse.unquote_plus(v)
+                return _json_loads(v)
             except Exception:
-                break
-            # if unquoting didn't change the string, break to avoid infinite loop
-            if v_unq == v:
-                break
-            v = v_unq
-        # Final attempt: try json.loads on the last value
-        try:
-            return json.loads(v)
-        except Exception:
-            return value
-    return value
+                # try to strip surrounding quotes then parse
+                if lead == '"' and v.endswith('"'):
+                    try:
+                        return _json_loads(v[1:-1])
+                    except Exception:
+                        pass
+        elif lead in _NUM_LEAD:
+            digits = v[1:] if lead == "-" else v
+            # plain JSON integers skip the decoder; leading zeros are not JSON numbers. Longer
+            # ones go through the decoder so oversized values behave exactly as before
+            if (
+                len(digits) <= _FAST_INT_DIGITS
+                and digits.isascii()
+                and digits.isdigit()
+                and (digits[0] != "0" or len(digits) == 1)
+            ):
+                return int(v)
+            try:
+                return _json_loads(v)
+            except Exception:
+                pass
+        elif v in _JSON_LITERALS:
+            return _JSON_LITERALS[v]
+        # not parsed — only percent/plus-encoded text can change by unquoting
+        if "%" not in v and "+" not in v:
+            break
+        v_unq = _unquote_plus(v)
+        if v_unq == v:
+            break
+        v = v_unq
+    # final attempt on the last (possibly still encoded once more) value
+    try:
+        return _json_loads(v)
+    except Exception:
+        return value
+
+
+def _parse_qs_fast(qs: str, headers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Single-pass equivalent of `parse_qs(qs, keep_blank_values=True)` + single-value flattening.
+
+    The first value of a key is stored as a plain string; a repeated key is promoted to a
+    list of all its values. Keys and values are only unquoted when they contain '%' or '+'.
+    When `headers` is given, `headers.<name>=value` pairs are collected into it (first value
+    wins) instead of the returned dict.
+    """
+    parsed: Dict[str, Any] = {}
+    # one scan of the whole string; unencoded querystrings skip the per-token checks
+    encoded = "%" in qs or "+" in qs
+    for pair in qs.split("&"):
+        if not pair:
+            continue
+        k, _, v = pair.partition("=")
+        if encoded and ("%" in k or "+" in k):
+            k = _unquote_plus(k)
+        if encoded and ("%" in v or "+" in v):
+            if _unquote_long is not None and len(v) > _LONG_TOKEN:
+                v = _unquote_long(v)
+            else:
+                v = _unquote_plus(v)
+        if headers is not None and k[:1] == "h" and k.startswith("headers."):
+            headers.setdefault(k[8:], v)
+            continue
+        if k not in parsed:
+            parsed[k] = v
+        elif isinstance(parsed[k], list):
+            parsed[k].append(v)
+        else:
+            parsed[k] = [parsed[k], v]
+    return parsed
 
 
 async def parse_http_params(request: Request) -> Dict[str, Any]:
@@ -64,34 +151,40 @@ async def parse_http_params(request: Request) -> Dict[str, Any]:
     - Always attempt robust decoding (double-encoded JSON) and return a plain Dict[str, Any].
     - On parse failure, raises HTTPException(400).
     """
-    logger.debug("parse_http_params: incoming request method=%s, url=%s", request.method, getattr(request, 'url', None))
+    debug = logger.isEnabledFor(logging.DEBUG)
+    scope = request.scope
+    if debug:
+        logger.debug("parse_http_params: incoming request method=%s, url=%s", request.method, getattr(request, 'url', None))
     # Start with query params (they are always available)
-    qs_bytes = request.scope.get("query_string", b"")
-    qs = qs_bytes.decode("utf-8") if isinstance(qs_bytes, (bytes, bytearray)) else str(qs_bytes)
-    query = urllib.parse.parse_qs(qs, keep_blank_values=True)
-
-    # Normalize single-value query params to plain strings (if multivalue, keep list)
-    normalized_query: Dict[str, Any] = {}
-    for k, v in query.items():
-        if len(v) == 1:
-            normalized_query[k] = v[0]
-        else:
-            normalized_query[k] = v
+    qs_bytes = scope.get("query_string", b"")
+    # single-value query params are plain strings (if multivalue, a list)
+    if qs_bytes:
+        qs = qs_bytes.decode("utf-8") if isinstance(qs_bytes, (bytes, bytearray)) else str(qs_bytes)
+        normalized_query = _parse_qs_fast(qs)
+    else:
+        # most bodyful requests carry no querystring at all; this stays a fresh dict (not a
+        # shared read-only singleton) because it can be returned and routes hand it to
+        # handlers as ctx["params"], which they may mutate, and routes check isinstance(dict)
+        normalized_query = {}
 
     # If there's a "params" query param, prefer that (it's JSON encoded by client)
     if "params" in normalized_query:
         try:
             decoded = _maybe_decode_json_str(normalized_query["params"])
-            logger.debug("parse_http_params: found 'params' in query (raw)=%s decoded=%s", normalized_query["params"], decoded)
+            if debug:
+                logger.debug("parse_http_params: found 'params' in query (raw)=%s decoded=%s", normalized_query["params"], decoded)
             # If client accidentally double-wrapped as {"params": {...}}, unwrap
             if isinstance(decoded, dict) and "params" in decoded and isinstance(decoded["params"], dict):
-                logger.debug("parse_http_params: unwrapped nested 'params' dict -> %s", decoded["params"])
+                if debug:
+                    logger.debug("parse_http_params: unwrapped nested 'params' dict -> %s", decoded["params"])
                 return decoded["params"]
             if isinstance(decoded, dict):
-                logger.debug("parse_http_params: returning decoded dict from query params -> %s", decoded)
+                if debug:
+                    logger.debug("parse_http_params: returning decoded dict from query params -> %s", decoded)
                 return decoded
             # if params is something else (like list) put under key "params"
-            logger.debug("parse_http_params: returning wrapped params -> %s", {"params": decoded})
+            if debug:
+                logger.debug("parse_http_params: returning wrapped params -> %s", {"params": decoded})
             return {"params": decoded}
         except Exception as e:
             raise HTTPException(
@@ -99,50 +192,91 @@ async def parse_http_params(request: Request) -> Dict[str, Any]:
             )
 
     # For non-GET: try to parse body
-    if request.method and request.method.upper() in ("POST", "PUT", "PATCH", "DELETE"):
-        # Fast path: try json
-        try:
-            body = await request.json()
-        except Exception:
-            # maybe form-encoded or empty
+    if scope["method"] in _BODY_METHODS:
+        # dispatch once on content type; clients posting JSON as text/plain still decode
+        if request.headers.get("content-type", "").startswith(_FORM_CONTENT_TYPES):
             try:
-                form = await request.form()
-                body = {k: v for k, v in form.items()}
+                body = dict(await request.form())
+            except Exception:
+                body = None
+        else:
+            raw = await request.body()
+            try:
+                body = _json_loads(raw) if raw else None
             except Exception:
                 body = None
 
-        if body is None:
-            # fallback to query string only
-            logger.debug("parse_http_params: body empty, returning normalized query -> %s", normalized_query)
-            return normalized_query
-
-        # if body contains "params"
-        if isinstance(body, dict) and "params" in body:
-            params_val = body["params"]
-            # the client sometimes sends {"params": "<json-string>"}
-            maybe = _maybe_decode_json_str(params_val)
-            logger.debug("parse_http_params: found 'params' in body (raw)=%s decoded=%s", params_val, maybe)
-            if isinstance(maybe, dict):
-                logger.debug("parse_http_params: returning decoded dict from body 'params' -> %s", maybe)
-                return maybe
-            logger.debug("parse_http_params: returning wrapped body params -> %s", {"params": maybe})
-            return {"params": maybe}
-
-        # if body looks already like a params dict
-        if isinstance(body, dict):
-            logger.debug("parse_http_params: returning body as params -> %s", body)
-            return body
-
-        # other types (list, string) -> wrap
-        wrapped = {"params": _maybe_decode_json_str(body)}
-        logger.debug("parse_http_params: returning wrapped non-dict body -> %s", wrapped)
-        return wrapped
+        match body:
+            case None:
+                # fallback to query string only
+                if debug:
+                    logger.debug("parse_http_params: body empty, returning normalized query -> %s", normalized_query)
+                return normalized_query
+
+            case {"params": params_val}:
+                # the client sometimes sends {"params": "<json-string>"}; the canonical
+                # object text decodes directly, anything else takes the full decoder
+                maybe = None
+                if type(params_val) is str and params_val[:1] == "{":
+                    try:
+                        maybe = _json_loads(params_val)
+                    except Exception:
+                        pass
+                if type(maybe) is not dict:
+                    maybe = _maybe_decode_json_str(params_val)
+                if debug:
+                    logger.debug("parse_http_params: found 'params' in body (raw)=%s decoded=%s", params_val, maybe)
+                if isinstance(maybe, dict):
+                    if debug:
+                        logger.debug("parse_http_params: returning decoded dict from body 'params' -> %s", maybe)
+                    return maybe
+                if debug:
+                    logger.debug("parse_http_params: returning wrapped body params -> %s", {"params": maybe})
+                return {"params": maybe}
+
+            case dict():
+                # body looks already like a params dict
+                if debug:
+                    logger.debug("parse_http_params: returning body as params -> %s", body)
+                return body
+
+            case _:
+                # other types (list, string) -> wrap
+                wrapped = {"params": _maybe_decode_json_str(body)}
+                if debug:
+                    logger.debug("parse_http_params: returning wrapped non-dict body -> %s", wrapped)
+                return wrapped
 
     # Fallback: return normalized query dict (no 'params' found)
-    logger.debug("parse_http_params: fallback returning normalized_query -> %s", normalized_query)
+    if debug:
+        logger.debug("parse_http_params: fallback returning normalized_query -> %s", normalized_query)
     return normalized_query
 
 
+# websocket payload keys mapped from the querystring
+_WS_MAPPING_KEYS = frozenset(
+    (
+        "url",
+        "topic",
+        "resumeSeq",
+        "subscriptionId",
+        "ackPolicy",
+        "compression",
+        "protocols",
+        "reconnectDelay",
+        "maxReconnectAttempts",
+        "heartbeatInterval",
+    )
+)
+# mapped keys coerced to numbers
+_WS_NUMERIC_KEYS = frozenset(("resumeSeq", "reconnectDelay", "maxReconnectAttempts", "heartbeatInterval"))
+
+
+def _single(v: Any) -> Any:
+    """First value of a repeated query key; other values pass through."""
+    return v[0] if isinstance(v, list) and v else v
+
+
 async def parse_websocket_params(
     websocket: WebSocket, wait_for_initial_message: bool = False
 ) -> Dict[str, Any]:
@@ -157,14 +291,30 @@ async def parse_websocket_params(
        - Accept a JSON message that contains the payload (common server/client patterns).
     4. Return a payload dict (possibly empty) — caller should validate required fields like 'url'.
     """
-    logger.debug("parse_websocket_params: incoming websocket scope path=%s client=%s", websocket.scope.get('path'), websocket.client)
+    payload = _parse_ws_query(websocket)
+    if payload is not None:
+        return payload
+    # Optional: consume first JSON message from client to extract params (only when explicitly requested)
+    if wait_for_initial_message:
+        return await _parse_ws_initial_message(websocket)
+    # Nothing found (fresh dict, as above: it becomes the handler's ctx["params"])
+    return {}
+
+
+def _parse_ws_query(websocket: WebSocket) -> Optional[Dict[str, Any]]:
+    """
+    Querystring half of `parse_websocket_params` (steps 1-2); None when the query yields nothing.
+    Kept synchronous so the common no-initial-message path allocates no extra coroutine.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    scope = websocket.scope
+    if debug:
+        logger.debug("parse_websocket_params: incoming websocket scope path=%s client=%s", scope.get('path'), websocket.client)
     # parse query string
-    qs_bytes = websocket.scope.get("query_string", b"")
+    qs_bytes = scope.get("query_string", b"")
     qs = qs_bytes.decode("utf-8") if isinstance(qs_bytes, (bytes, bytearray)) else str(qs_bytes)
-    query = urllib.parse.parse_qs(qs, keep_blank_values=True)
-
-    def _single(v):
-        return v[0] if isinstance(v, list) and v else v
+    headers: Dict[str, Any] = {}
+    query = _parse_qs_fast(qs, headers)
 
     payload: Dict[str, Any] = {}
 
@@ -172,95 +322,89 @@ async def parse_websocket_params(
     if "params" in query:
         raw = _single(query["params"])
         decoded = _maybe_decode_json_str(raw)
-        logger.debug("parse_websocket_params: found 'params' in query (raw)=%s decoded=%s", raw, decoded)
+        if debug:
+            logger.debug("parse_websocket_params: found 'params' in query (raw)=%s decoded=%s", raw, decoded)
         # unwrap accidental nested payloads {"params": {...}}
         if isinstance(decoded, dict) and "params" in decoded and isinstance(decoded["params"], dict):
-            logger.debug("parse_websocket_params: unwrapped nested 'params' dict -> %s", decoded["params"])
+            if debug:
+                logger.debug("parse_websocket_params: unwrapped nested 'params' dict -> %s", decoded["params"])
             return decoded["params"]
         if isinstance(decoded, dict):
-            logger.debug("parse_websocket_params: returning decoded dict from query params -> %s", decoded)
+            if debug:
+                logger.debug("parse_websocket_params: returning decoded dict from query params -> %s", decoded)
             return decoded
-        logger.debug("parse_websocket_params: returning wrapped params -> %s", {"params": decoded})
+        if debug:
+            logger.debug("parse_websocket_params: returning wrapped params -> %s", {"params": decoded})
         return {"params": decoded}
 
     # Map common websocket payload keys (strings come from querystring)
-    mapping_keys = [
-        "url",
-        "topic",
-        "resumeSeq",
-        "subscriptionId",
-        "ackPolicy",
-        "compression",
-        "protocols",
-        "reconnectDelay",
-        "maxReconnectAttempts",
-        "heartbeatInterval",
-    ]
-
-    for key in mapping_keys:
-        if key in query:
-            v = _single(query[key])
-            # try to coerce numeric fields
-            if key in ("resumeSeq", "reconnectDelay", "maxReconnectAttempts", "heartbeatInterval"):
-                try:
-                    payload[key] = int(v)
-                except Exception:
-                    try:
-                        payload[key] = float(v)
-                    except Exception:
-                        payload[key] = v
-            else:
-                        payload[key] = _maybe_decode_json_str(v)
-                        logger.debug("parse_websocket_params: mapped key=%s value=%s", key, payload[key])
-
-    # Handle potential header-like query params (headers.<name>=value)
-    headers = {}
-    for qk, qv in query.items():
-        if qk.startswith("headers.") and qv:
-            header_name = qk.split(".", 1)[1]
-            headers[header_name] = _single(qv)
+    # (walk the query in its own order; only mapped keys are picked up)
+    for key, qv in query.items():
+        if key not in _WS_MAPPING_KEYS:
+            continue
+        v = _single(qv)
+        # try to coerce numeric fields
+        if key in _WS_NUMERIC_KEYS:
+            payload[key] = _coerce_num(v)
+        else:
+            payload[key] = _maybe_decode_json_str(v)
+            if debug:
+                logger.debug("parse_websocket_params: mapped key=%s value=%s", key, payload[key])
+
+    # Header-like query params (headers.<name>=value) were collected while parsing
     if headers:
         payload["headers"] = headers
-        logger.debug("parse_websocket_params: mapped headers=%s", headers)
+        if debug:
+            logger.debug("parse_websocket_params: mapped headers=%s", headers)
 
     # If we already found meaningful fields, return
     if payload:
-        logger.debug("parse_websocket_params: returning payload from query mapping -> %s", payload)
+        if debug:
+            logger.debug("parse_websocket_params: returning payload from query mapping -> %s", payload)
         return payload
+    return None
 
-    # Optional: consume first JSON message from client to extract params (only when explicitly requested)
-    if wait_for_initial_message:
+
+async def _parse_ws_initial_message(websocket: WebSocket) -> Dict[str, Any]:
+    """
+    Step 3 of `parse_websocket_params`: receive (consume) the first message and extract params.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    try:
+        message = await websocket.receive_text()
         try:
-            message = await websocket.receive_text()
-            try:
-                parsed = json.loads(message)
-            except Exception:
+            parsed = _json_loads(message)
+        except Exception:
+            if debug:
                 logger.debug("parse_websocket_params: initial message not JSON, returning raw initialMessage=%s", message)
-                # not JSON -> return as raw string under 'initialMessage'
-                return {"initialMessage": message}
-            # If parsed has 'params' or is dict, process same as HTTP
-            if isinstance(parsed, dict):
-                if "params" in parsed:
-                    maybe = parsed["params"]
-                    maybe = _maybe_decode_json_str(maybe) if isinstance(maybe, str) else maybe
+            # not JSON -> return as raw string under 'initialMessage'
+            return {"initialMessage": message}
+        # If parsed has 'params' or is dict, process same as HTTP
+        if isinstance(parsed, dict):
+            if "params" in parsed:
+                maybe = parsed["params"]
+                maybe = _maybe_decode_json_str(maybe) if isinstance(maybe, str) else maybe
+                if debug:
                     logger.debug("parse_websocket_params: initial message contained 'params' raw=%s decoded=%s", parsed["params"], maybe)
-                    if isinstance(maybe, dict):
+                if isinstance(maybe, dict):
+                    if debug:
                         logger.debug("parse_websocket_params: returning decoded dict from initial message -> %s", maybe)
-                        return maybe
+                    return maybe
+                if debug:
                     logger.debug("parse_websocket_params: returning wrapped initial message params -> %s", {"params": maybe})
-                    return {"params": maybe}
-                # Map keys directly
+                return {"params": maybe}
+            # Map keys directly
+            if debug:
                 logger.debug("parse_websocket_params: returning parsed initial message dict -> %s", parsed)
-                return parsed
-            # otherwise wrap
+            return parsed
+        # otherwise wrap
+        if debug:
             logger.debug("parse_websocket_params: returning wrapped initialMessage -> %s", {"initialMessage": parsed})
-            return {"initialMessage": parsed}
-        except WebSocketDisconnect:
-            raise
-        except Exception:
-            # unable to read; return empty payload
+        return {"initialMessage": parsed}
+    except WebSocketDisconnect:
+        raise
+    except Exception:
+        # unable to read; return empty payload
+        if debug:
             logger.debug("parse_websocket_params: failed to receive initial message, returning empty payload")
-            return {}
-
-    # Nothing found
-    return {}
+        return {}
@@ -16,14 +16,12 @@ long_description = read_text(HERE / "README.md")
 
 
 def read_version() -> str:
-    import re
-
     p = HERE / "cereon_sdk" / "_version.py"
     try:
         txt = p.read_text(encoding="utf8")
-        m = re.search(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", txt, flags=re.M)
-        if m:
-            return m.group(1)
+        for line in txt.splitlines():
+            if line.startswith("__version__"):
+                return line.split("=", 1)[1].strip().strip("'\"")
     except Exception:
         pass
     return "0.0.0"
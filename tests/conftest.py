@@ -0,0 +1,18 @@
+# tests/conftest.py
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Minimal standalone Django settings for the Django integration tests."""
+    try:
+        import django
+        from django.conf import settings
+    except ImportError:  # Django extra not installed; those tests skip themselves
+        return
+    if not settings.configured:
+        settings.configure(
+            INSTALLED_APPS=["rest_framework"],
+            SECRET_KEY="cereon-sdk-tests",
+            ALLOWED_HOSTS=["*"],
+        )
+        django.setup()
@@ -0,0 +1,137 @@
+# tests/test_django_consumers.py
+import asyncio
+import weakref
+
+import pytest
+
+pytest.importorskip("channels")
+pytest.importorskip("rest_framework")
+
+from channels.testing import WebsocketCommunicator  # noqa: E402
+
+from cereon_sdk.django import consumers  # noqa: E402
+from cereon_sdk.django.consumers import BaseCardConsumer  # noqa: E402
+
+
+class CountingConsumer(BaseCardConsumer):
+    heartbeat_interval_sec = 0
+
+    async def handle(self, ctx):
+        for i in range(3):
+            yield {"i": i, "x": ctx["params"].get("x")}
+
+
+class BatchedConsumer(CountingConsumer):
+    batch_enabled = True
+    batch_max_size = 2
+
+
+class BatchedErrorConsumer(CountingConsumer):
+    batch_enabled = True
+
+    async def handle(self, ctx):
+        yield {"i": 0}
+        raise RuntimeError("boom")
+
+
+class FloodConsumer(CountingConsumer):
+    batch_enabled = True
+    batch_max_size = 50
+    batch_max_pending = 10
+    peak = 0
+
+    async def handle(self, ctx):
+        for i in range(500):
+            FloodConsumer.peak = max(FloodConsumer.peak, len(self._outq))
+            yield {"i": i}
+
+
+async def _connect(consumer_cls, path="/ws"):
+    comm = WebsocketCommunicator(consumer_cls.as_asgi(), path)
+    connected, _ = await comm.connect()
+    assert connected
+    return comm
+
+
+async def _subscribe(comm, **payload):
+    await comm.send_json_to({"action": "subscribe", **payload})
+    assert (await comm.receive_json_from(timeout=1))["action"] == "subscribed"
+
+
+async def _drain(comm):
+    frames = []
+    while not await comm.receive_nothing(timeout=0.2):
+        frames.append(await comm.receive_json_from())
+    return frames
+
+
+async def test_subscribe_streams_handler_items():
+    comm = await _connect(CountingConsumer, "/ws?params=%7B%22x%22%3A7%7D")
+    await _subscribe(comm, subscriptionId="s1", ackPolicy="manual")
+    messages = [await comm.receive_json_from(timeout=1) for _ in range(3)]
+    assert [m["data"] for m in messages] == [{"i": i, "x": 7} for i in range(3)]
+    assert all(m["subscriptionIds"] == ["s1"] for m in messages)
+    assert len({m["id"] for m in messages}) == 3
+    await comm.send_json_to({"action": "unsubscribe", "subscriptionId": "s1"})
+    assert (await comm.receive_json_from(timeout=1))["action"] == "unsubscribed"
+    await comm.disconnect()
+
+
+async def test_batched_frames_keep_order_and_size():
+    comm = await _connect(BatchedConsumer)
+    await _subscribe(comm, subscriptionId="s1")
+    frames = await _drain(comm)
+    assert all(f["action"] == "batch" for f in frames)
+    assert max(len(f["items"]) for f in frames) <= 2
+    assert [item["data"]["i"] for f in frames for item in f["items"]] == [0, 1, 2]
+    await comm.disconnect()
+
+
+async def test_batched_error_follows_queued_records():
+    comm = await _connect(BatchedErrorConsumer)
+    await _subscribe(comm)
+    frames = await _drain(comm)
+    assert [f["action"] for f in frames] == ["batch", "error"]
+    await comm.disconnect()
+
+
+async def test_batch_queue_is_bounded_by_max_pending():
+    FloodConsumer.peak = 0
+    comm = await _connect(FloodConsumer)
+    await _subscribe(comm, subscriptionId="s1")
+    frames = await _drain(comm)
+    assert [item["data"]["i"] for f in frames for item in f["items"]] == list(range(500))
+    assert FloodConsumer.peak <= FloodConsumer.batch_max_pending
+    await comm.disconnect()
+
+
+class _FakeConsumer:
+    __hash__ = object.__hash__
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.sent = []
+
+    async def send(self, text_data):
+        await asyncio.sleep(self.delay)
+        self.sent.append(text_data)
+
+
+async def test_heartbeat_ticker_is_not_held_up_by_a_slow_consumer():
+    fast, slow = _FakeConsumer(0), _FakeConsumer(10)
+    registry = weakref.WeakSet([fast, slow])
+    task = asyncio.create_task(consumers._heartbeat_ticker(0.05, registry))
+    try:
+        await asyncio.sleep(0.08)
+        assert fast.sent and not slow.sent
+        await asyncio.sleep(0.1)
+        # the timed-out send drops the slow consumer; the fast one keeps its heartbeats
+        assert slow not in registry and fast in registry
+        assert len(fast.sent) >= 2
+    finally:
+        task.cancel()
+
+
+async def test_heartbeat_ticker_exits_when_registry_is_empty():
+    registry = weakref.WeakSet()
+    await asyncio.wait_for(consumers._heartbeat_ticker(0.01, registry), 1)
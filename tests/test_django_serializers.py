@@ -0,0 +1,75 @@
+# tests/test_django_serializers.py
+import pytest
+
+pytest.importorskip("rest_framework")
+
+from rest_framework.exceptions import ValidationError  # noqa: E402
+
+from cereon_sdk.django import serializers as s  # noqa: E402
+
+
+CASES = [
+    (s.BaseCardRecordSerializer, {"x": 1}),
+    (s.ChartCardRecordSerializer, {"data": [{"a": 1}]}),
+    (s.NumberCardRecordSerializer, {"value": 1.5}),
+    (s.TableCardRecordSerializer, {"rows": [{"a": 1}], "columns": ["a"], "total_count": 3}),
+]
+
+
+@pytest.mark.parametrize("cls,data", CASES)
+def test_fast_validate_matches_drf(cls, data):
+    record = {"kind": "k", "cardId": "c", "report_id": "r", "data": data, "meta": {"a": 1}}
+    slow = cls(data=record)
+    slow.is_valid(raise_exception=True)
+    probe, _ = cls._get_compiled_plan()
+    fast = probe.fast_validate(record)
+    assert dict(fast) == dict(slow.validated_data)
+    assert probe.to_record(fast) == slow.to_record()
+
+
+@pytest.mark.parametrize("cls,data", CASES)
+def test_fast_validate_errors_match_drf(cls, data):
+    record = {"kind": "k"}
+    with pytest.raises(ValidationError) as slow:
+        cls(data=record).is_valid(raise_exception=True)
+    probe, _ = cls._get_compiled_plan()
+    with pytest.raises(ValidationError) as fast:
+        probe.fast_validate(record)
+    assert fast.value.detail == slow.value.detail
+
+
+def test_compiled_plan_is_per_subclass():
+    base, _ = s.BaseCardRecordSerializer._get_compiled_plan()
+    chart, _ = s.ChartCardRecordSerializer._get_compiled_plan()
+    assert base is not chart
+    assert type(chart) is s.ChartCardRecordSerializer
+
+
+@pytest.mark.parametrize(
+    "cls,kind,data",
+    [
+        (s.TableCardRecordSerializer, "table", {"rows": [], "columns": []}),
+        (s.HtmlCardRecordSerializer, "html", None),
+        (s.MarkdownCardRecordSerializer, "markdown", None),
+    ],
+)
+def test_default_kind_and_snake_case_precedence(cls, kind, data):
+    record = {"cardId": "camel", "card_id": "snake", "reportId": "r"}
+    if data is not None:
+        record["data"] = data
+    slow = cls(data=record)
+    slow.is_valid(raise_exception=True)
+    assert slow.validated_data["kind"] == kind
+    assert slow.validated_data["card_id"] == "snake"
+    probe, _ = cls._get_compiled_plan()
+    assert dict(probe.fast_validate(record)) == dict(slow.validated_data)
+
+
+def test_fast_render_matches_field_order_and_defaults():
+    table = {"kind": "table", "card_id": "c", "report_id": "r", "data": {"rows": [{"a": 1}], "columns": ["a"], "extra": 1}}
+    assert s.TableCardRecordSerializer(table).data["data"] == {"rows": [{"a": 1}], "columns": ["a"], "totalCount": None}
+    html = {"kind": "html", "card_id": "c", "report_id": "r", "data": {"content": "x"}}
+    assert s.HtmlCardRecordSerializer(html).data["data"] == {"content": "x", "rawHtml": None, "styles": None}
+    # data missing a required field is passed through untouched, as on the DRF path
+    chart = {"kind": "chart", "card_id": "c", "report_id": "r", "data": {"nope": 1}}
+    assert s.ChartCardRecordSerializer(chart).data["data"] == {"nope": 1}
@@ -0,0 +1,76 @@
+# tests/test_django_utils.py
+import datetime
+import decimal
+import uuid
+
+import pytest
+
+pytest.importorskip("rest_framework")
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from cereon_sdk.django import utils  # noqa: E402
+
+RENDERERS = [utils._json_render, utils._json_render_stdlib]
+
+
+@pytest.mark.parametrize("render", RENDERERS)
+def test_json_render_matches_drf_renderer(render):
+    data = {
+        "text": "line\u2028para\u2029caf\u00e9",
+        "amount": decimal.Decimal("1.50"),
+        "at": datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+        "uid": uuid.UUID(int=1),
+        "wide": 2**70,
+        "items": [1.5, None, True],
+    }
+    assert render(data) == JSONRenderer().render(data)
+
+
+def test_json_render_stdlib_rejects_nan():
+    with pytest.raises(ValueError):
+        utils._json_render_stdlib({"x": float("nan")})
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("1" + "0" * 29, 10**29),
+        ("-9500000000000000000", -9500000000000000000),
+        ('{"id": 123456789012345678901234567890}', {"id": 123456789012345678901234567890}),
+        ("[1.5, 2]", [1.5, 2]),
+    ],
+)
+def test_json_loads_keeps_wide_integers_exact(raw, expected):
+    assert utils._json_loads(raw) == expected
+    assert utils._json_loads(raw.encode()) == expected
+    assert utils._maybe_decode_json_str(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["NaN", "Infinity", "-Infinity", "[NaN]"])
+def test_non_finite_tokens_decode_like_stdlib(raw):
+    import json
+    import math
+
+    expected = json.loads(raw)
+    decoded = utils._maybe_decode_json_str(raw)
+    first = lambda v: v[0] if isinstance(v, list) else v  # noqa: E731
+    assert type(decoded) is type(expected)
+    assert math.isnan(first(decoded)) if raw.endswith("NaN") else decoded == expected
+
+
+def test_json_dumps_encodes_wide_integers():
+    import json
+
+    assert json.loads(utils._json_dumps({"id": 2**70})) == {"id": 2**70}
+
+
+def test_cached_query_params_round_trip_exactly():
+    import math
+    from urllib.parse import quote
+
+    qs = "params=" + quote('{"id": 123456789012345678901234567890, "x": NaN}')
+    for _ in range(2):  # miss, then hit
+        params = utils.parse_query_params_cached(qs)
+        assert params["id"] == 123456789012345678901234567890
+        assert math.isnan(params["x"])
@@ -0,0 +1,181 @@
+# tests/test_django_views.py
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("rest_framework")
+
+from django.test import RequestFactory  # noqa: E402
+from rest_framework import serializers  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+
+from cereon_sdk.django.views import BaseCardAPIView  # noqa: E402
+
+
+class RecordOut(serializers.Serializer):
+    id = serializers.IntegerField()
+    value = serializers.FloatField()
+
+
+class SyncView(BaseCardAPIView):
+    response_serializer = RecordOut
+
+    def handle(self, ctx):
+        return [{"id": 1, "value": 1}]
+
+
+def _get(view_cls):
+    response = asyncio.run(view_cls().get(Request(RequestFactory().get("/card"))))
+    if hasattr(response, "data"):  # DRF Response (errors, raw_json_response = False)
+        return response.status_code, response.data
+    return response.status_code, json.loads(response.content)
+
+
+def test_subclass_overriding_call_handler_is_not_bypassed():
+    calls = []
+
+    class HookedView(SyncView):
+        async def _call_handler(self, ctx):
+            calls.append("hook")
+            return await super()._call_handler(ctx)
+
+    class HookedChildView(HookedView):
+        pass
+
+    assert _get(HookedChildView) == (200, [{"id": 1, "value": 1.0}])
+    assert calls == ["hook"]
+
+
+def test_subclass_switching_to_async_handler_is_respecialized():
+    class AsyncChildView(SyncView):
+        async def handle(self, ctx):
+            return [{"id": 2, "value": 2}]
+
+    class AsyncGrandchildView(AsyncChildView):
+        pass
+
+    assert AsyncGrandchildView.get is not SyncView.get
+    assert _get(AsyncGrandchildView) == (200, [{"id": 2, "value": 2.0}])
+
+
+def test_dict_subclass_results_are_single_records():
+    from collections import OrderedDict
+
+    returned = []
+
+    class ReturnDictView(BaseCardAPIView):
+        response_serializer = RecordOut
+
+        def handle(self, ctx):
+            # `serializer.data` is a ReturnDict
+            data = RecordOut({"id": 8, "value": 1.5}).data
+            returned.append(type(data).__name__)
+            return data
+
+    class OrderedDictView(BaseCardAPIView):
+        response_serializer = RecordOut
+
+        def handle(self, ctx):
+            return OrderedDict(id=9, value=2)
+
+    assert _get(ReturnDictView) == (200, {"id": 8, "value": 1.5})
+    assert returned == ["ReturnDict"]
+    assert _get(OrderedDictView) == (200, {"id": 9, "value": 2.0})
+
+
+def _view_returning(make_result):
+    class ResultView(BaseCardAPIView):
+        response_serializer = RecordOut
+
+        def handle(self, ctx):
+            return make_result()
+
+    return ResultView
+
+
+def _records(n):
+    return [{"id": i, "value": str(i)} for i in range(n)]
+
+
+def test_streamed_iterables_validate_per_item():
+    from collections import OrderedDict
+
+    async def agen():
+        for record in _records(3):
+            yield record
+
+    expected = [{"id": i, "value": float(i)} for i in range(3)]
+    assert _get(_view_returning(lambda: _records(3))) == (200, expected)
+    assert _get(_view_returning(lambda: tuple(_records(3)))) == (200, expected)
+    assert _get(_view_returning(lambda: (r for r in _records(3)))) == (200, expected)
+    assert _get(_view_returning(agen)) == (200, expected)
+    assert _get(_view_returning(lambda: iter(_records(3)))) == (200, expected)
+    # dict-subclass records inside a stream are records, not iterated further
+    ordered = lambda: (OrderedDict(r) for r in _records(3))  # noqa: E731
+    assert _get(_view_returning(ordered)) == (200, expected)
+
+
+def test_streamed_errors_match_list_serializer():
+    bad = [{"id": 1, "value": 1}, {"id": "x", "value": 1}, {"id": 3}]
+    expected = RecordOut(data=bad, many=True)
+    assert not expected.is_valid()
+
+    async def agen():
+        for record in bad:
+            yield record
+
+    for make in (lambda: list(bad), lambda: (r for r in bad), agen):
+        status_code, body = _get(_view_returning(make))
+        assert status_code == 400
+        assert body == {"detail": expected.errors}
+
+
+def _undetected_async(fn):
+    """A `functools.wraps` decorator without `markcoroutinefunction`."""
+    import functools
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+class AwaitableResultView(BaseCardAPIView):
+    response_serializer = RecordOut
+
+    def handle(self, ctx):
+        async def load():
+            return [{"id": 4, "value": 4}]
+
+        return load()
+
+
+class WrappedAsyncView(BaseCardAPIView):
+    response_serializer = RecordOut
+
+    @_undetected_async
+    async def handle(self, ctx):
+        return {"id": 5, "value": 5}
+
+
+class InlineAwaitableView(AwaitableResultView):
+    handler_is_nonblocking = True
+
+
+def test_call_handler_awaits_awaitable_results():
+    for view_cls, expected in (
+        (AwaitableResultView, [{"id": 4, "value": 4}]),
+        (InlineAwaitableView, [{"id": 4, "value": 4}]),
+        (WrappedAsyncView, {"id": 5, "value": 5}),
+    ):
+        ctx = {"request": None, "params": {}, "filters": None}
+        assert asyncio.run(view_cls()._call_handler(ctx)) == expected
+
+
+def test_generated_dispatch_awaits_awaitable_results():
+    assert AwaitableResultView.get is not BaseCardAPIView._dispatch  # specialized path
+    assert _get(AwaitableResultView) == (200, [{"id": 4, "value": 4.0}])
+    assert _get(InlineAwaitableView) == (200, [{"id": 4, "value": 4.0}])
+    assert _get(WrappedAsyncView) == (200, {"id": 5, "value": 5.0})
@@ -0,0 +1,188 @@
+# tests/test_fastapi_utils.py
+import asyncio
+from urllib.parse import quote
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from starlette.requests import Request  # noqa: E402
+
+from cereon_sdk.fastapi import utils  # noqa: E402
+
+
+def _request(method="GET", qs=b"", body=b"", content_type=None):
+    headers = [(b"content-type", content_type.encode())] if content_type else []
+    scope = {"type": "http", "method": method, "query_string": qs, "headers": headers, "path": "/"}
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request(scope, receive)
+
+
+def _http_params(*args, **kwargs):
+    return asyncio.run(utils.parse_http_params(_request(*args, **kwargs)))
+
+
+class _FakeWebSocket:
+    def __init__(self, qs=b"", message=None):
+        self.scope = {"query_string": qs, "path": "/ws"}
+        self.client = None
+        self._message = message
+
+    async def receive_text(self):
+        return self._message
+
+
+def _ws_params(qs=b"", message=None, wait=False):
+    return asyncio.run(utils.parse_websocket_params(_FakeWebSocket(qs, message), wait))
+
+
+WIDE = 123456789012345678901234567890
+
+
+def test_wide_integers_decode_exactly():
+    body = b'{"params": {"id": %d}}' % WIDE
+    assert _http_params("POST", body=body, content_type="application/json") == {"id": WIDE}
+    qs = b"params=" + quote('{"id": %d}' % WIDE).encode()
+    assert _http_params(qs=qs) == {"id": WIDE}
+    assert _ws_params(qs) == {"id": WIDE}
+    assert _ws_params(message='{"params": {"id": %d}}' % WIDE, wait=True) == {"id": WIDE}
+
+
+def _reference_decode(value):
+    """`_maybe_decode_json_str` as released before the fast-path rewrite (stdlib json)."""
+    import json
+    import urllib.parse
+
+    if not isinstance(value, str):
+        return value
+    v = value.strip()
+    for _ in range(3):
+        if v.startswith(("{", "[", '"')) or v in ("true", "false", "null") or (v and v[0].isdigit()):
+            try:
+                return json.loads(v)
+            except Exception:
+                if v.startswith('"') and v.endswith('"'):
+                    try:
+                        return json.loads(v[1:-1])
+                    except Exception:
+                        pass
+        v_unq = urllib.parse.unquote_plus(v)
+        if v_unq == v:
+            break
+        v = v_unq
+    try:
+        return json.loads(v)
+    except Exception:
+        return value
+
+
+def _encoded(text, times):
+    for _ in range(times):
+        text = quote(text, safe="")
+    return text
+
+
+_DECODE_SEEDS = [
+    '{"a": 1, "b": [true, null]}',
+    "[1, 2.5]",
+    '"quoted"',
+    "42",
+    "-7",
+    "05",
+    "1" + "0" * 30,
+    "true",
+    "NaN",
+    "-Infinity",
+    "plain-topic",
+    "ws://host/path?x=1",
+    "a+b",
+    "100%",
+    "",
+]
+
+
+@pytest.mark.parametrize("times", [0, 1, 2, 3, 4])
+@pytest.mark.parametrize("seed", _DECODE_SEEDS)
+def test_maybe_decode_matches_reference(seed, times):
+    import json
+
+    for raw in (_encoded(seed, times), " " + _encoded(seed, times) + " "):
+        got, expected = utils._maybe_decode_json_str(raw), _reference_decode(raw)
+        assert type(got) is type(expected)
+        assert json.dumps(got) == json.dumps(expected)
+
+
+def test_triple_encoded_object_decodes():
+    raw = _encoded('{"a": 1}', 3)
+    assert raw.startswith("%25257B")
+    assert utils._maybe_decode_json_str(raw) == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "body,content_type,qs,expected",
+    [
+        (b'{"k": 1}', "application/json", b"", {"k": 1}),
+        (b'{"params": {"z": 3}}', "application/json", b"", {"z": 3}),
+        (b'{"params": "{\\"z\\": 3}"}', "application/json", b"", {"z": 3}),
+        (b'{"params": [1]}', "application/json", b"", {"params": [1]}),
+        (b"[1]", "application/json", b"", {"params": [1]}),
+        (b'{"k": 1}', "text/plain;charset=UTF-8", b"", {"k": 1}),
+        (b'{"k": 1}', None, b"", {"k": 1}),
+        (b'{"k":', "application/json", b"", {}),
+        (b"", "application/json", b"a=1", {"a": "1"}),
+        (b"a=1&b=2", "application/x-www-form-urlencoded", b"", {"a": "1", "b": "2"}),
+    ],
+)
+def test_http_body_is_read_once_per_content_type(body, content_type, qs, expected):
+    assert _http_params("POST", qs=qs, body=body, content_type=content_type) == expected
+
+
+_QUERY_STRINGS = [
+    "",
+    "a=1&b=2&b=3&c=",
+    "a&&b=%2B+x",
+    "k%20y=v%3D1=2",
+    "=x",
+    "a=1&a=2&a=3",
+    "h=%E2%9C%93",
+    "long=" + quote('{"text": "' + "x y/" * 40 + '"}'),
+]
+
+
+@pytest.mark.parametrize("qs", _QUERY_STRINGS)
+def test_parse_qs_fast_matches_parse_qs(qs):
+    from urllib.parse import parse_qs
+
+    expected = {k: v[0] if len(v) == 1 else v for k, v in parse_qs(qs, keep_blank_values=True).items()}
+    assert utils._parse_qs_fast(qs) == expected
+
+
+def test_ws_query_maps_keys_and_headers():
+    qs = b"url=ws%3A%2F%2Fh&topic=t&resumeSeq=5&reconnectDelay=1.5&heartbeatInterval=x&headers.Auth=tok&other=1"
+    assert _ws_params(qs) == {
+        "url": "ws://h",
+        "topic": "t",
+        "resumeSeq": 5,
+        "reconnectDelay": 1.5,
+        "heartbeatInterval": "x",
+        "headers": {"Auth": "tok"},
+    }
+    assert _ws_params(b"other=1") == {}
+
+
+@pytest.mark.parametrize("token", ["", "plain", "a+b%20c", "%E2%9C%93" * 30, "%zz%4", "100%", "%2B" * 40])
+def test_numba_unquote_matches_stdlib(token):
+    pytest.importorskip("numba")
+    from urllib.parse import unquote_plus
+
+    from cereon_sdk.fastapi._qs_numba import unquote_plus as numba_unquote_plus
+
+    assert numba_unquote_plus(token) == unquote_plus(token)